@@ -1,19 +1,48 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, session, send_from_directory, jsonify
+import time
+_process_started = time.perf_counter()  # start of the cold-start timing report
+
+from flask import Flask, Request, Response, abort, g, render_template, request, redirect, url_for, flash, session, send_from_directory, jsonify, has_request_context, stream_with_context
+from flask.signals import before_render_template, template_rendered
 from flask_sqlalchemy import SQLAlchemy
-from flask_mail import Mail, Message
-from werkzeug.security import generate_password_hash, check_password_hash
-from werkzeug.utils import secure_filename
-from datetime import datetime
+from sqlalchemy import case, event, func, inspect, tuple_
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, load_only
+from sqlalchemy.pool import NullPool, QueuePool
+from jinja2 import ChoiceLoader, FileSystemBytecodeCache, ModuleLoader, TemplateNotFound, __version__ as jinja2_version
+from markupsafe import escape
+from werkzeug.security import generate_password_hash, check_password_hash, safe_join
+from werkzeug.utils import secure_filename, send_file as werkzeug_send_file
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from contextlib import contextmanager
 from functools import wraps
+import base64
+import bisect
+import csv
+import hashlib
+import heapq
+import io
+import json
+import mimetypes
 import os
+import re
 import secrets
+import stat
+import tempfile
+import zipfile
+import threading
+from urllib.parse import urlencode
+
+# Load environment variables from .env file (for local development; Vercel injects them)
+if not os.environ.get('VERCEL'):
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass  # dotenv not installed, will use system env vars
 
-# Load environment variables from .env file (for local development)
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass  # dotenv not installed, will use system env vars
+startup_timings = {'imports': round((time.perf_counter() - _process_started) * 1000, 1)}
 
 # Flask App Configuration
 app = Flask(__name__, 
@@ -23,8 +52,45 @@ app = Flask(__name__,
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', secrets.token_hex(16))
 app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///shramic.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Connection pooling: 'auto' uses NullPool on serverless (VERCEL) and a QueuePool elsewhere,
+# or force 'null' (e.g. behind an external pgbouncer) / 'queue'
+app.config['DB_POOL'] = os.environ.get('DB_POOL', 'auto')
+app.config['DB_POOL_SIZE'] = int(os.environ.get('DB_POOL_SIZE', 5))
+app.config['DB_MAX_OVERFLOW'] = int(os.environ.get('DB_MAX_OVERFLOW', 10))
+app.config['DB_POOL_TIMEOUT'] = int(os.environ.get('DB_POOL_TIMEOUT', 30))
+app.config['DB_POOL_RECYCLE'] = int(os.environ.get('DB_POOL_RECYCLE', 1800))  # below typical server/LB idle timeouts
+app.config['DB_CONNECT_TIMEOUT'] = int(os.environ.get('DB_CONNECT_TIMEOUT', 10))
+# Startup: apply pending migrations automatically (otherwise run 'flask init-db' when deploying),
+# warm up at import time on serverless, and cap the retry backoff after a failed startup
+app.config['AUTO_MIGRATE'] = os.environ.get('AUTO_MIGRATE', 'True') == 'True'
+app.config['STARTUP_WARMUP'] = os.environ.get('STARTUP_WARMUP', 'True' if os.environ.get('VERCEL') else 'False') == 'True'
+app.config['STARTUP_RETRY_MAX'] = int(os.environ.get('STARTUP_RETRY_MAX', 60))
 app.config['UPLOAD_FOLDER'] = '/tmp/uploads'  # Use /tmp for serverless
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+# Templates precompiled by build_templates.py, used on serverless where every instance starts with an
+# empty /tmp; long-running servers get more from the shared bytecode cache below ('' disables the bundle)
+app.config['TEMPLATE_BUNDLE'] = os.environ.get('TEMPLATE_BUNDLE', os.path.join(
+    os.path.dirname(app.root_path), 'compiled_templates.zip') if os.environ.get('VERCEL') else '')
+# Jinja bytecode cache shared by every worker on the host: unset uses Jinja's per-user 0700 temp
+# directory, a path must be private to this user (owner-only writable), '' disables the cache
+app.config['TEMPLATE_CACHE_DIR'] = os.environ.get('TEMPLATE_CACHE_DIR')
+# Re-checking template mtimes on every render is only useful while editing them
+app.config['TEMPLATES_AUTO_RELOAD'] = os.environ.get(
+    'TEMPLATES_AUTO_RELOAD', 'False' if os.environ.get('FLASK_ENV') == 'production' else 'True') == 'True'
+# Seconds a cached SiteSettings snapshot is served before re-reading it, so instances converge
+app.config['SETTINGS_CACHE_TTL'] = int(os.environ.get('SETTINGS_CACHE_TTL', 60))
+app.config['STATS_CACHE_TTL'] = int(os.environ.get('STATS_CACHE_TTL', 30))
+# 'memory' keeps an in-process index; 'database' uses FTS5 (SQLite) or tsvector (PostgreSQL)
+app.config['SEARCH_BACKEND'] = os.environ.get('SEARCH_BACKEND', 'database' if os.environ.get('VERCEL') else 'memory')
+# Seconds before the in-process index is rebuilt from scratch, picking up edits and deletions
+# committed by other workers (new rows and internship edits are caught up on every search)
+app.config['SEARCH_INDEX_TTL'] = int(os.environ.get('SEARCH_INDEX_TTL', 300))
+# Listing pagination: 'keyset' (cursor tokens, flat cost at any depth) or 'offset' (numbered pages)
+app.config['PAGINATION_MODE'] = os.environ.get('PAGINATION_MODE', 'keyset')
+# Keyset totals: 'exact' runs COUNT(*); 'approximate' counts at most PAGINATION_COUNT_CAP rows
+# and falls back to the planner's row estimate on PostgreSQL once the cap is reached
+app.config['PAGINATION_TOTAL'] = os.environ.get('PAGINATION_TOTAL', 'approximate')
+app.config['PAGINATION_COUNT_CAP'] = int(os.environ.get('PAGINATION_COUNT_CAP', 1000))
 
 # Flask-Mail Configuration
 app.config['MAIL_SERVER'] = os.environ.get('MAIL_SERVER', 'smtp.gmail.com')
@@ -34,11 +100,89 @@ app.config['MAIL_USERNAME'] = os.environ.get('MAIL_USERNAME', 'shramicnetworks@g
 app.config['MAIL_PASSWORD'] = os.environ.get('MAIL_PASSWORD', '')
 app.config['MAIL_DEFAULT_SENDER'] = os.environ.get('MAIL_DEFAULT_SENDER', 'Shramic <shramicnetworks@gmail.com>')
 
-db = SQLAlchemy(app)
-mail = Mail(app)
+# Resume blobs: 'filesystem' (UPLOAD_FOLDER) or 's3' (any S3-compatible endpoint, e.g. MinIO)
+app.config['RESUME_STORAGE'] = os.environ.get('RESUME_STORAGE', 'filesystem')
+app.config['S3_BUCKET'] = os.environ.get('S3_BUCKET', '')
+app.config['S3_PREFIX'] = os.environ.get('S3_PREFIX', 'resumes/')
+app.config['S3_ENDPOINT_URL'] = os.environ.get('S3_ENDPOINT_URL') or None
+app.config['S3_REGION'] = os.environ.get('S3_REGION') or None
+app.config['S3_PRESIGN_EXPIRES'] = int(os.environ.get('S3_PRESIGN_EXPIRES', 300))
+# Resume downloads: browser cache lifetime, plus optional proxy offload ('x-sendfile' or 'x-accel-redirect')
+app.config['RESUME_CACHE_MAX_AGE'] = int(os.environ.get('RESUME_CACHE_MAX_AGE', 31536000))
+app.config['RESUME_OFFLOAD'] = os.environ.get('RESUME_OFFLOAD', '')
+app.config['RESUME_ACCEL_PREFIX'] = os.environ.get('RESUME_ACCEL_PREFIX', '/protected-uploads/')
+# Shared-cache lifetime (s-maxage) for validated public pages, e.g. at the Vercel edge
+app.config['EDGE_CACHE_SECONDS'] = int(os.environ.get('EDGE_CACHE_SECONDS', 60))
+# Full-page cache for public routes: 'memory', 'filesystem', 'redis' (REDIS_URL) or 'none'
+app.config['PAGE_CACHE_BACKEND'] = os.environ.get('PAGE_CACHE_BACKEND', 'memory')
+app.config['PAGE_CACHE_TTL'] = int(os.environ.get('PAGE_CACHE_TTL', 300))
+# Must be private to this user (created 0700; refused if owned by someone else or group/world writable)
+app.config['PAGE_CACHE_DIR'] = os.environ.get('PAGE_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'shramic-page-cache'))
+app.config['REDIS_URL'] = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+# 'thread' sends queued email from a local thread pool; 'queue' waits for /tasks/outbox/drain
+app.config['OUTBOX_MODE'] = os.environ.get('OUTBOX_MODE', 'queue' if os.environ.get('VERCEL') else 'thread')
+app.config['OUTBOX_WORKERS'] = int(os.environ.get('OUTBOX_WORKERS', 4))
+app.config['MAIL_BATCH_SIZE'] = int(os.environ.get('MAIL_BATCH_SIZE', 50))  # messages per SMTP connection
+app.config['MAIL_RATE_LIMIT'] = float(os.environ.get('MAIL_RATE_LIMIT', 0))  # messages/second, 0 = unlimited
+app.config['OUTBOX_MAX_ATTEMPTS'] = int(os.environ.get('OUTBOX_MAX_ATTEMPTS', 5))
+# Seconds /tasks/outbox/drain keeps sending; keep it under the function's max duration
+app.config['OUTBOX_DRAIN_SECONDS'] = float(os.environ.get('OUTBOX_DRAIN_SECONDS', 8))
+# Bearer token for /tasks/outbox/drain; Vercel Cron (vercel.json "crons") sends it when set in the project env
+app.config['CRON_SECRET'] = os.environ.get('CRON_SECRET', '')
+# Applicants changed per UPDATE/commit by the bulk status API
+app.config['BULK_UPDATE_CHUNK_SIZE'] = int(os.environ.get('BULK_UPDATE_CHUNK_SIZE', 1000))
+# Rows fetched per round trip from the server-side cursor behind applicant exports
+app.config['EXPORT_BATCH_SIZE'] = int(os.environ.get('EXPORT_BATCH_SIZE', 1000))
+# Per-route latency/SQL/template/SMTP metrics, exported at /metrics (Prometheus text; bearer
+# METRICS_TOKEN or an admin session) and per response in a Server-Timing header
+app.config['METRICS_ENABLED'] = os.environ.get('METRICS_ENABLED', 'True') == 'True'
+app.config['METRICS_TOKEN'] = os.environ.get('METRICS_TOKEN', '')
+app.config['SERVER_TIMING'] = os.environ.get('SERVER_TIMING', 'True') == 'True'
+# Development/test query diagnostics: flag statement shapes repeated more than NPLUSONE_THRESHOLD
+# times in one request (N+1 loads), log queries slower than SLOW_QUERY_MS with their EXPLAIN plan,
+# and warn past REQUEST_QUERY_BUDGET statements per request (0 = no budget).
+# QUERY_DEBUG_STRICT raises QueryBudgetExceeded instead of logging, to fail test runs.
+app.config['QUERY_DEBUG'] = os.environ.get('QUERY_DEBUG', 'False') == 'True'
+app.config['QUERY_DEBUG_STRICT'] = os.environ.get('QUERY_DEBUG_STRICT', 'False') == 'True'
+app.config['NPLUSONE_THRESHOLD'] = int(os.environ.get('NPLUSONE_THRESHOLD', 5))
+app.config['SLOW_QUERY_MS'] = float(os.environ.get('SLOW_QUERY_MS', 100))
+app.config['REQUEST_QUERY_BUDGET'] = int(os.environ.get('REQUEST_QUERY_BUDGET', 0))
+
+def database_engine_options(config):
+    """Engine options for the configured database and runtime.
+
+    A serverless process handles one request at a time and may be frozen
+    between them, so pooled connections there only go stale; each checkout
+    opens a fresh connection instead (point DATABASE_URL at pgbouncer to keep
+    that cheap). Long-running servers keep a bounded QueuePool, ping
+    connections before use and recycle them before idle timeouts hit.
+    SQLite keeps Flask-SQLAlchemy's defaults.
+    """
+    uri = config['SQLALCHEMY_DATABASE_URI']
+    if uri.startswith('sqlite'):
+        return {}
+    options = {}
+    if uri.startswith('postgres'):
+        options['connect_args'] = {'connect_timeout': config['DB_CONNECT_TIMEOUT']}
+    pool = config['DB_POOL']
+    if pool == 'auto':
+        pool = 'null' if os.environ.get('VERCEL') else 'queue'
+    if pool == 'null':
+        options['poolclass'] = NullPool
+    else:
+        options.update(
+            poolclass=QueuePool,
+            pool_size=config['DB_POOL_SIZE'],
+            max_overflow=config['DB_MAX_OVERFLOW'],
+            pool_timeout=config['DB_POOL_TIMEOUT'],
+            pool_recycle=config['DB_POOL_RECYCLE'],
+            pool_pre_ping=True,
+        )
+    return options
+
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = database_engine_options(app.config)
 
-# Ensure upload folder exists
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+db = SQLAlchemy(app)
 
 # ======================= DATABASE MODELS =======================
 
@@ -68,6 +212,12 @@ class Internship(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     applicants = db.relationship('Applicant', backref='internship', lazy=True, cascade='all, delete-orphan')
 
+    __table_args__ = (
+        # Public listings: is_active (+ location_type) ordered newest first
+        db.Index('ix_internship_active_created', 'is_active', 'created_at', 'id'),
+        db.Index('ix_internship_created', 'created_at', 'id'),
+    )
+
 class Applicant(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     internship_id = db.Column(db.Integer, db.ForeignKey('internship.id'), nullable=False)
@@ -82,6 +232,13 @@ class Applicant(db.Model):
     status = db.Column(db.String(50), default='pending')
     applied_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # Admin applicant list: optional internship/status filter, ordered newest first
+        db.Index('ix_applicant_internship_applied', 'internship_id', 'applied_at', 'id'),
+        db.Index('ix_applicant_status_applied', 'status', 'applied_at', 'id'),
+        db.Index('ix_applicant_applied', 'applied_at', 'id'),
+    )
+
 class SiteSettings(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     company_name = db.Column(db.String(100), default='Shramic')
@@ -93,6 +250,7 @@ class SiteSettings(db.Model):
     social_twitter = db.Column(db.String(300))
     social_facebook = db.Column(db.String(300))
     logo_url = db.Column(db.String(300), default='/static/img/logo.png')
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 class ContactMessage(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -103,8 +261,73 @@ class ContactMessage(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     is_read = db.Column(db.Boolean, default=False)
 
+    __table_args__ = (
+        db.Index('ix_contact_message_read_created', 'is_read', 'created_at'),
+        db.Index('ix_contact_message_created', 'created_at', 'id'),
+    )
+
+class EmailOutbox(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    recipient = db.Column(db.String(120), nullable=False)
+    subject = db.Column(db.String(300), nullable=False)
+    template = db.Column(db.String(200), nullable=False)
+    context = db.Column(db.Text)  # JSON of template variables; model references stored as ids
+    base_url = db.Column(db.String(300))
+    status = db.Column(db.String(20), default='pending')  # pending, sending, sent, failed
+    attempts = db.Column(db.Integer, default=0)
+    last_error = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    next_attempt_at = db.Column(db.DateTime, default=datetime.utcnow)
+    sent_at = db.Column(db.DateTime)
+    claim_token = db.Column(db.String(32))
+    campaign_id = db.Column(db.Integer, db.ForeignKey('email_campaign.id'))
+    campaign = db.relationship('EmailCampaign', backref=db.backref('emails', lazy='dynamic'))
+
+    __table_args__ = (
+        # claim_outbox_batch: due entries, then the rows a worker just leased
+        db.Index('ix_email_outbox_status_next', 'status', 'next_attempt_at'),
+        db.Index('ix_email_outbox_claim_token', 'claim_token'),
+        db.Index('ix_email_outbox_campaign_status', 'campaign_id', 'status'),
+    )
+
+class EmailCampaign(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    subject = db.Column(db.String(300), nullable=False)
+    message_body = db.Column(db.Text, nullable=False)
+    total = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+class SchemaVersion(db.Model):
+    __tablename__ = 'schema_version'
+    version = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    name = db.Column(db.String(200), nullable=False)
+    applied_at = db.Column(db.DateTime, default=datetime.utcnow)
+
 # ======================= HELPER FUNCTIONS =======================
 
+def pool_status():
+    """Connection pool class and, for QueuePool, its size and current checkouts"""
+    pool = db.engine.pool
+    status = {'class': type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    return status
+
+def private_directory(path):
+    """Create ``path`` readable by this user only and refuse it if anyone else could write into it"""
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode):
+        raise OSError(f"{path} is not a directory")
+    if hasattr(os, 'getuid') and (info.st_uid != os.getuid() or info.st_mode & (stat.S_IWGRP | stat.S_IWOTH)):
+        raise OSError(f"{path} must be owned by uid {os.getuid()} and not writable by group or others")
+    return path
+
 def login_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
@@ -120,22 +343,2204 @@ def allowed_file(filename):
 def create_slug(title):
     return title.lower().replace(' ', '-').replace('/', '-')
 
+_settings_cache = {'values': None, 'expires': 0.0}
+_settings_lock = threading.Lock()
+
+def load_site_settings():
+    """Fetch the persistent SiteSettings row, creating it on first use"""
+    settings = SiteSettings.query.first()
+    if not settings:
+        settings = SiteSettings()
+        db.session.add(settings)
+        db.session.commit()
+    return settings
+
+def cache_site_settings(values):
+    """Replace the cached settings snapshot and restart its TTL"""
+    with _settings_lock:
+        _settings_cache['values'] = values
+        _settings_cache['expires'] = time.monotonic() + app.config['SETTINGS_CACHE_TTL']
+
+def invalidate_site_settings():
+    with _settings_lock:
+        _settings_cache['values'] = None
+
 def get_site_settings():
+    """Return site settings from the process-wide cache.
+
+    The cache holds plain column values and every call gets a fresh transient
+    SiteSettings built from them, so templates never touch expired or detached
+    session state. Use load_site_settings() to get a row that can be edited.
+    """
+    values = _settings_cache['values']
+    if values is None or time.monotonic() >= _settings_cache['expires']:
+        try:
+            settings = load_site_settings()
+            values = {column.key: getattr(settings, column.key) for column in SiteSettings.__table__.columns}
+            cache_site_settings(values)
+        except Exception as e:
+            print(f"Error getting site settings: {e}")
+            # Return default settings object without saving to DB
+            return SiteSettings(
+                company_name='Shramic',
+                tagline='Empowering Careers Through Excellence'
+            )
+    return SiteSettings(**values)
+
+def site_settings_version(settings):
+    """Short hash of the settings' column values, for cache keys and validators"""
+    values = [str(getattr(settings, column.key)) for column in SiteSettings.__table__.columns]
+    return hashlib.sha1('\x1f'.join(values).encode()).hexdigest()[:12]
+
+# ======================= METRICS =======================
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 250)
+
+def format_labels(names, values):
+    """Render a Prometheus label set, escaping backslashes, quotes and newlines in the values"""
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{name}="{value}"')
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+class Counter:
+    def __init__(self, name, help, labels=()):
+        self.name, self.help, self.labels = name, help, labels
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def inc(self, *label_values, amount=1):
+        with self.lock:
+            self.values[label_values] = self.values.get(label_values, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self.lock:
+            for label_values, value in sorted(self.values.items()):
+                lines.append(f"{self.name}{format_labels(self.labels, label_values)} {value}")
+        return lines
+
+class Histogram:
+    def __init__(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        self.name, self.help, self.labels, self.buckets = name, help, labels, buckets
+        self.series = {}  # label values -> {'buckets': [non-cumulative counts], 'sum': float, 'count': int}
+        self.lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        with self.lock:
+            series = self.series.get(label_values)
+            if series is None:
+                series = self.series[label_values] = {'buckets': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                series['buckets'][index] += 1
+            series['sum'] += value
+            series['count'] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self.lock:
+            for label_values, series in sorted(self.series.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, series['buckets']):
+                    cumulative += count
+                    lines.append(f"{self.name}_bucket{format_labels(self.labels + ('le',), label_values + (bound,))} {cumulative}")
+                lines.append(f"{self.name}_bucket{format_labels(self.labels + ('le',), label_values + ('+Inf',))} {series['count']}")
+                lines.append(f"{self.name}_sum{format_labels(self.labels, label_values)} {series['sum']:.6f}")
+                lines.append(f"{self.name}_count{format_labels(self.labels, label_values)} {series['count']}")
+        return lines
+
+REQUESTS = Counter('shramic_http_requests_total', 'HTTP responses by endpoint, method and status.',
+                   ('endpoint', 'method', 'status'))
+REQUEST_LATENCY = Histogram('shramic_http_request_duration_seconds', 'Time from request start to response.',
+                            ('endpoint', 'method'))
+REQUEST_QUERIES = Histogram('shramic_http_request_db_queries', 'SQL statements executed per request.',
+                            ('endpoint',), buckets=QUERY_COUNT_BUCKETS)
+REQUEST_DB_TIME = Histogram('shramic_http_request_db_seconds', 'Time spent in SQL per request.', ('endpoint',))
+TEMPLATE_TIME = Histogram('shramic_template_render_seconds', 'render_template() time per template.', ('template',))
+SMTP_TIME = Histogram('shramic_smtp_send_seconds', 'Time to hand one message to the SMTP server.')
+METRICS = (REQUESTS, REQUEST_LATENCY, REQUEST_QUERIES, REQUEST_DB_TIME, TEMPLATE_TIME, SMTP_TIME)
+
+def request_metrics():
+    """Timing totals for the current request, or None outside one (e.g. outbox worker threads)"""
+    return g.get('metrics') if has_request_context() else None
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def stop_query_timer(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get('query_started')
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    metrics = request_metrics()
+    if metrics is not None:
+        metrics['db_queries'] += 1
+        metrics['db'] += elapsed
+    for tracker in getattr(_query_trackers, 'stack', ()):
+        tracker.record(statement)
+    if app.config['QUERY_DEBUG'] and elapsed * 1000 >= app.config['SLOW_QUERY_MS']:
+        log_slow_query(conn, statement, parameters, elapsed, executemany)
+
+_template_timers = threading.local()
+
+@before_render_template.connect_via(app)
+def start_template_timer(sender, template, context, **extra):
+    _template_timers.__dict__.setdefault('stack', []).append(time.perf_counter())
+
+@template_rendered.connect_via(app)
+def stop_template_timer(sender, template, context, **extra):
+    stack = getattr(_template_timers, 'stack', None)
+    if not stack:
+        return
+    elapsed = time.perf_counter() - stack.pop()
+    TEMPLATE_TIME.observe(elapsed, template.name or '<string>')
+    metrics = request_metrics()
+    if metrics is not None:
+        metrics['template'] += elapsed
+
+def record_smtp_time(elapsed):
+    SMTP_TIME.observe(elapsed)
+    metrics = request_metrics()
+    if metrics is not None:
+        metrics['smtp'] += elapsed
+
+@app.before_request
+def start_request_metrics():
+    if app.config['METRICS_ENABLED']:
+        g.metrics = {'started': time.perf_counter(), 'db_queries': 0, 'db': 0.0, 'template': 0.0, 'smtp': 0.0}
+
+@app.after_request
+def record_request_metrics(response):
+    metrics = request_metrics()
+    if metrics is None:
+        return response
+    elapsed = time.perf_counter() - metrics['started']
+    endpoint = request.url_rule.endpoint if request.url_rule else 'unmatched'
+    REQUESTS.inc(endpoint, request.method, response.status_code)
+    REQUEST_LATENCY.observe(elapsed, endpoint, request.method)
+    REQUEST_QUERIES.observe(metrics['db_queries'], endpoint)
+    REQUEST_DB_TIME.observe(metrics['db'], endpoint)
+    if app.config['SERVER_TIMING']:
+        timings = [f"app;dur={elapsed * 1000:.1f}",
+                   f"db;dur={metrics['db'] * 1000:.1f};desc=\"{metrics['db_queries']} queries\"",
+                   f"tpl;dur={metrics['template'] * 1000:.1f}"]
+        if metrics['smtp']:
+            timings.append(f"smtp;dur={metrics['smtp'] * 1000:.1f}")
+        response.headers.add('Server-Timing', ', '.join(timings))
+    return response
+
+def render_metrics():
+    """All metrics in Prometheus text exposition format (this process only)"""
+    lines = []
+    for metric in METRICS:
+        lines.extend(metric.render())
+    pool = pool_status()
+    for key in ('size', 'checked_in', 'checked_out', 'overflow'):
+        if key in pool:
+            lines.append(f"# TYPE shramic_db_pool_{key} gauge")
+            lines.append(f"shramic_db_pool_{key} {pool[key]}")
+    return '\n'.join(lines) + '\n'
+
+# ======================= QUERY DIAGNOSTICS =======================
+
+_query_trackers = threading.local()
+_PLACEHOLDER_RE = re.compile(r"%\(\w+\)s|%s")
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised by query_budget() and strict QUERY_DEBUG; an AssertionError so test runners report a failure"""
+
+def statement_shape(statement):
+    """Normalize SQL so the same query with different parameters (or IN-list lengths) compares equal"""
+    shape = _PLACEHOLDER_RE.sub('?', statement)
+    shape = _LITERAL_RE.sub('?', shape)
+    shape = _IN_LIST_RE.sub('(?)', shape)
+    return ' '.join(shape.split())
+
+class QueryTracker:
+    """Counts the statements, by shape, issued on this thread while it is active"""
+
+    def __init__(self):
+        self.total = 0
+        self.shapes = {}
+
+    def start(self):
+        _query_trackers.__dict__.setdefault('stack', []).append(self)
+        return self
+
+    def stop(self):
+        stack = getattr(_query_trackers, 'stack', [])
+        if self in stack:
+            stack.remove(self)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def record(self, statement):
+        shape = statement_shape(statement)
+        self.total += 1
+        self.shapes[shape] = self.shapes.get(shape, 0) + 1
+
+    def repeated(self, threshold):
+        """(count, shape) for every shape issued more than ``threshold`` times, most frequent first"""
+        return sorted(((count, shape) for shape, count in self.shapes.items() if count > threshold), reverse=True)
+
+    def problems(self, max_queries=0, max_repeats=0):
+        problems = []
+        if max_queries and self.total > max_queries:
+            problems.append(f"{self.total} queries (budget {max_queries})")
+        if max_repeats:
+            for count, shape in self.repeated(max_repeats):
+                problems.append(f"{count}x {shape[:300]}")
+        return problems
+
+@contextmanager
+def query_budget(max_queries, max_repeats=None):
+    """Fail with QueryBudgetExceeded if the block runs more than ``max_queries`` statements,
+    or any one statement shape more than ``max_repeats`` times (default NPLUSONE_THRESHOLD).
+
+        with query_budget(8):
+            client.get('/admin/applicants')
+    """
+    if max_repeats is None:
+        max_repeats = app.config['NPLUSONE_THRESHOLD']
+    with QueryTracker() as tracker:
+        yield tracker
+    problems = tracker.problems(max_queries, max_repeats)
+    if problems:
+        raise QueryBudgetExceeded('Query budget exceeded: ' + '; '.join(problems))
+
+def log_slow_query(conn, statement, parameters, elapsed, executemany):
+    """Print a slow statement with its EXPLAIN plan, run on a raw DBAPI cursor so no events fire"""
+    lines = [f"Slow query ({elapsed * 1000:.0f}ms): {' '.join(statement.split())[:1000]}"]
+    if not executemany and statement.lstrip().upper().startswith('SELECT'):
+        prefix = 'EXPLAIN QUERY PLAN ' if conn.dialect.name == 'sqlite' else 'EXPLAIN '
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(prefix + statement, parameters)
+            lines.extend('    ' + ' | '.join(str(column) for column in row) for row in cursor.fetchall())
+        except Exception as e:
+            lines.append(f"    (EXPLAIN failed: {e})")
+        finally:
+            cursor.close()
+    print('\n'.join(lines))
+
+@app.before_request
+def start_query_tracking():
+    if app.config['QUERY_DEBUG']:
+        g.query_tracker = QueryTracker().start()
+
+@app.after_request
+def report_query_tracking(response):
+    tracker = g.pop('query_tracker', None) if has_request_context() else None
+    if tracker is None:
+        return response
+    tracker.stop()
+    problems = tracker.problems(app.config['REQUEST_QUERY_BUDGET'], app.config['NPLUSONE_THRESHOLD'])
+    if problems:
+        message = f"Query problems in {request.method} {request.path}: " + '; '.join(problems)
+        if app.config['QUERY_DEBUG_STRICT']:
+            raise QueryBudgetExceeded(message)
+        print(f"⚠️  {message}")
+    return response
+
+@app.teardown_request
+def stop_query_tracking(exc):
+    # after_request doesn't run when the view raised; don't leave the tracker counting
+    tracker = g.pop('query_tracker', None)
+    if tracker is not None:
+        tracker.stop()
+
+# ======================= STATIC ASSETS =======================
+
+ASSET_MAX_AGE = 31536000  # fingerprinted files never change, so browsers may keep them a year
+
+_asset_manifest = None
+
+def get_asset_manifest():
+    """Load static/dist/manifest.json written by build_assets.py (empty if assets were never built)"""
+    global _asset_manifest
+    if _asset_manifest is None:
+        try:
+            with open(os.path.join(app.static_folder, 'dist', 'manifest.json')) as f:
+                _asset_manifest = json.load(f)
+        except (OSError, ValueError):
+            _asset_manifest = {}
+    return _asset_manifest
+
+def asset_entry(src):
+    """Manifest entry for a static path ('img/logo.png' or '/static/img/logo.png'), or None"""
+    prefix = app.static_url_path + '/'
+    if src and src.startswith(prefix):
+        src = src[len(prefix):]
+    return get_asset_manifest().get(src)
+
+def asset_url(src, width=None, fmt=None, **kwargs):
+    """url_for('static') replacement that points at the fingerprinted build of a file.
+
+    ``width`` picks the smallest variant at least that wide and ``fmt`` another
+    encoding (webp/avif). Paths without a build (external logo URLs, an unbuilt
+    tree) fall back to the original file.
+    """
+    entry = asset_entry(src)
+    if entry is None:
+        if src and (src.startswith(app.static_url_path + '/') or '://' in src):
+            return src
+        return url_for('static', filename=src, **kwargs)
+    filename = entry['file']
+    variants = entry.get('variants', {}).get(fmt or os.path.splitext(filename)[1][1:], {})
+    if fmt and not variants:
+        return None
+    if width is not None and variants:
+        wide_enough = [int(w) for w in variants if int(w) >= width] or [max(int(w) for w in variants)]
+        filename = variants[str(min(wide_enough))]
+    elif fmt:
+        filename = variants[str(max(int(w) for w in variants))]
+    return url_for('static', filename=f'dist/{filename}', **kwargs)
+
+def asset_srcset(src, fmt=None):
+    """'url 128w, url 256w, ...' for the variants of one format, or '' when there are none"""
+    entry = asset_entry(src)
+    if entry is None:
+        return ''
+    fmt = fmt or os.path.splitext(entry['file'])[1][1:]
+    variants = entry.get('variants', {}).get(fmt, {})
+    return ', '.join(f"{url_for('static', filename='dist/' + variants[w])} {w}w"
+                     for w in sorted(variants, key=int))
+
+app.jinja_env.globals.update(asset_url=asset_url, asset_srcset=asset_srcset)
+
+# ======================= TEMPLATE CACHES =======================
+
+def template_source_hash(name):
+    path = safe_join(os.path.join(app.root_path, app.template_folder), name)
+    if path is None or not os.path.isfile(path):
+        return None
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+class PrecompiledTemplateLoader(ModuleLoader):
+    """Templates compiled to Python modules ahead of time by build_templates.py.
+
+    A template is taken from the bundle only while its source still matches
+    the hash recorded at build time; new or edited templates raise
+    TemplateNotFound so the ChoiceLoader falls through to the normal loader.
+    """
+
+    def __init__(self, bundle):
+        super().__init__(bundle)
+        with zipfile.ZipFile(bundle) as archive:
+            manifest = json.loads(archive.read('manifest.json'))
+        self.jinja_version = manifest['jinja_version']
+        self.hashes = manifest['templates']
+
+    def get_source(self, environment, template):
+        raise TemplateNotFound(template)
+
+    def list_templates(self):
+        return sorted(self.hashes)
+
+    def load(self, environment, name, globals=None):
+        expected = self.hashes.get(name)
+        if expected is None or template_source_hash(name) != expected:
+            raise TemplateNotFound(name)
+        return super().load(environment, name, globals)
+
+def install_template_bundle():
+    bundle = app.config['TEMPLATE_BUNDLE']
+    if not bundle or not os.path.isfile(bundle):
+        return
     try:
-        settings = SiteSettings.query.first()
-        if not settings:
-            settings = SiteSettings()
-            db.session.add(settings)
-            db.session.commit()
-        return settings
+        loader = PrecompiledTemplateLoader(bundle)
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+        print(f"Ignoring template bundle {bundle}: {e}")
+        return
+    if loader.jinja_version != jinja2_version:
+        print(f"Ignoring template bundle built with Jinja {loader.jinja_version} (running {jinja2_version})")
+        return
+    app.jinja_env.loader = ChoiceLoader([loader, app.jinja_env.loader])
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """Filesystem bytecode cache that keeps rendering when the directory can't be written"""
+
+    def dump_bytecode(self, bucket):
+        try:
+            super().dump_bytecode(bucket)
+        except OSError as e:
+            print(f"Template bytecode cache not written ({self.directory}): {e}")
+
+def install_bytecode_cache():
+    """Reuse compiled template code across processes; a bucket is invalidated when its source changes"""
+    directory = app.config['TEMPLATE_CACHE_DIR']
+    if directory == '':
+        return
+    # Cached buckets are unmarshalled into code, so never read them from a directory others can write
+    try:
+        if directory is not None:
+            private_directory(directory)
+        app.jinja_env.bytecode_cache = TemplateBytecodeCache(directory)
+    except (OSError, RuntimeError) as e:
+        print(f"Template bytecode cache disabled: {e}")
+
+install_template_bundle()
+install_bytecode_cache()
+
+def serve_static(filename):
+    """Static files, with immutable caching and pre-compressed copies for fingerprinted builds"""
+    if not filename.startswith('dist/'):
+        return app.send_static_file(filename)
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    response = None
+    for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+        compressed = safe_join(app.static_folder, filename + suffix)
+        if request.accept_encodings[encoding] and compressed and os.path.isfile(compressed):
+            response = send_from_directory(app.static_folder, filename + suffix, mimetype=mimetype,
+                                           max_age=ASSET_MAX_AGE)
+            response.content_encoding = encoding
+            break
+    if response is None:
+        response = send_from_directory(app.static_folder, filename, mimetype=mimetype, max_age=ASSET_MAX_AGE)
+    response.vary.add('Accept-Encoding')
+    response.cache_control.immutable = True
+    return response
+
+app.view_functions['static'] = serve_static
+
+# ======================= QUERY HELPERS =======================
+
+def with_internship(query):
+    """Load each applicant's internship title/location in the same SELECT instead of lazily per row"""
+    return query.options(
+        joinedload(Applicant.internship).load_only(Internship.id, Internship.title, Internship.location)
+    )
+
+def applicant_counts(internship_ids):
+    """Map internship id -> number of applicants using one GROUP BY query"""
+    if not internship_ids:
+        return {}
+    rows = db.session.query(Applicant.internship_id, func.count(Applicant.id)) \
+        .filter(Applicant.internship_id.in_(internship_ids)) \
+        .group_by(Applicant.internship_id)
+    return dict(rows.all())
+
+def internship_choices():
+    """Internship id/title pairs for filter dropdowns, without loading descriptions"""
+    return Internship.query.options(load_only(Internship.id, Internship.title)).all()
+
+# ======================= PAGINATION =======================
+
+class KeysetPage:
+    """One page of a newest-first listing, navigated with opaque next/prev cursors instead of OFFSET"""
+
+    def __init__(self, items, per_page, next_cursor=None, prev_cursor=None, total=None, total_kind='exact'):
+        self.items = items
+        self.per_page = per_page
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+        self.total = total
+        self.total_kind = total_kind  # 'exact', 'capped' (at least total) or 'estimate'
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_prev(self):
+        return self.prev_cursor is not None
+
+    @property
+    def total_label(self):
+        if self.total_kind == 'capped':
+            return f"{self.total:,}+"
+        if self.total_kind == 'estimate':
+            return f"~{self.total:,}"
+        return f"{self.total:,}"
+
+def encode_cursor(direction, sort_value, row_id):
+    payload = json.dumps([direction, sort_value.isoformat(), row_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+def decode_cursor(token):
+    """Return (direction, sort_value, row_id) or None for a missing or malformed cursor"""
+    if not token:
+        return None
+    try:
+        direction, sort_value, row_id = json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+        if direction not in ('after', 'before') or not isinstance(row_id, int):
+            return None
+        return direction, datetime.fromisoformat(sort_value), row_id
+    except (ValueError, TypeError):
+        return None
+
+def keyset_rows(query, sort_column, id_column, position, per_page):
+    """Fetch one page plus one look-ahead row; returns (rows, has_next, has_prev)"""
+    key = tuple_(sort_column, id_column)
+    if position is None:
+        rows = query.order_by(sort_column.desc(), id_column.desc()).limit(per_page + 1).all()
+        return rows[:per_page], len(rows) > per_page, False
+    direction, sort_value, row_id = position
+    if direction == 'after':
+        rows = query.filter(key < tuple_(sort_value, row_id)) \
+            .order_by(sort_column.desc(), id_column.desc()).limit(per_page + 1).all()
+        return rows[:per_page], len(rows) > per_page, True
+    rows = query.filter(key > tuple_(sort_value, row_id)) \
+        .order_by(sort_column.asc(), id_column.asc()).limit(per_page + 1).all()
+    return rows[:per_page][::-1], True, len(rows) > per_page
+
+def listing_total(query, id_column):
+    """Row count for a listing as (total, kind), bounded by PAGINATION_TOTAL/PAGINATION_COUNT_CAP"""
+    query = query.order_by(None).with_entities(id_column)
+    if app.config['PAGINATION_TOTAL'] == 'exact':
+        return query.count(), 'exact'
+    cap = app.config['PAGINATION_COUNT_CAP']
+    capped = db.session.query(func.count()).select_from(query.limit(cap + 1).subquery()).scalar()
+    if capped <= cap:
+        return capped, 'exact'
+    if db.engine.dialect.name == 'postgresql':
+        sql = query.statement.compile(dialect=db.engine.dialect, compile_kwargs={'literal_binds': True})
+        plan = db.session.execute(db.text(f'EXPLAIN (FORMAT JSON) {sql}')).scalar()
+        estimate = int(plan[0]['Plan']['Plan Rows'])
+        if estimate > cap:
+            return estimate, 'estimate'
+    return cap, 'capped'
+
+def paginate_listing(query, sort_column, per_page, load=None):
+    """Page through query newest first by (sort_column, id).
+
+    Keyset mode reads the ``cursor`` request arg and seeks straight to the
+    position it encodes, so page 400 costs the same as page 1. Offset mode
+    keeps the numbered ``page`` arg and Flask-SQLAlchemy's Pagination.
+    ``load`` adds eager-loading options to the item query only, leaving the
+    count query plain.
+    """
+    id_column = sort_column.class_.id
+    items_query = load(query) if load else query
+    if app.config['PAGINATION_MODE'] != 'keyset':
+        page = request.args.get('page', 1, type=int)
+        return items_query.order_by(sort_column.desc(), id_column.desc()) \
+            .paginate(page=page, per_page=per_page, error_out=False)
+
+    position = decode_cursor(request.args.get('cursor'))
+    rows, has_next, has_prev = keyset_rows(items_query, sort_column, id_column, position, per_page)
+    if not rows and position is not None:
+        # Stale cursor (rows deleted or edited since); start again from the top
+        rows, has_next, has_prev = keyset_rows(items_query, sort_column, id_column, None, per_page)
+    total, total_kind = listing_total(query, id_column)
+    next_cursor = prev_cursor = None
+    if rows and has_next:
+        next_cursor = encode_cursor('after', getattr(rows[-1], sort_column.key), rows[-1].id)
+    if rows and has_prev:
+        prev_cursor = encode_cursor('before', getattr(rows[0], sort_column.key), rows[0].id)
+    return KeysetPage(rows, per_page, next_cursor, prev_cursor, total, total_kind)
+
+# ======================= CHANGE TRACKING =======================
+
+_commit_listeners = []
+
+def on_commit(listener):
+    """Register listener(changes) to run after every successful commit.
+
+    ``changes`` is a list of (operation, model_name, values) tuples captured at
+    flush time, so listeners never have to touch expired ORM state.
+    """
+    _commit_listeners.append(listener)
+    return listener
+
+@event.listens_for(Session, 'after_flush')
+def collect_changes(session, flush_context):
+    changes = session.info.setdefault('committed_changes', [])
+    for operation, objects in (('insert', session.new), ('update', session.dirty), ('delete', session.deleted)):
+        for obj in objects:
+            if operation == 'update' and not session.is_modified(obj, include_collections=False):
+                continue
+            state = inspect(obj)
+            values = {attr.key: state.dict[attr.key] for attr in state.mapper.column_attrs if attr.key in state.dict}
+            changes.append((operation, type(obj).__name__, values))
+
+@event.listens_for(Session, 'after_commit')
+def dispatch_changes(session):
+    changes = session.info.pop('committed_changes', None)
+    if not changes:
+        return
+    for listener in _commit_listeners:
+        try:
+            listener(changes)
+        except Exception as e:
+            print(f"Commit listener error: {e}")
+
+@event.listens_for(Session, 'after_rollback')
+def discard_changes(session):
+    session.info.pop('committed_changes', None)
+
+@on_commit
+def refresh_settings_cache(changes):
+    """Write committed SiteSettings edits through to the cache so this instance sees them immediately"""
+    columns = {column.key for column in SiteSettings.__table__.columns}
+    for operation, model, values in changes:
+        if model != 'SiteSettings':
+            continue
+        if operation != 'delete' and columns <= values.keys():
+            cache_site_settings({key: values[key] for key in columns})
+        else:
+            invalidate_site_settings()
+
+# ======================= SEARCH INDEX =======================
+
+SEARCH_LIMIT = 15
+
+def tokenize(text):
+    """Split text into lowercase alphanumeric search tokens"""
+    return re.findall(r'[a-z0-9]+', (text or '').lower())
+
+class SearchIndex:
+    """Prefix-searchable inverted index over internships and applicants.
+
+    Built lazily from a column-only scan on the first search, then kept in sync
+    incrementally from committed changes, so a lookup only touches the postings
+    of the tokens that match the query instead of every row in both tables.
+    Commits from other workers are picked up by refresh(): every search catches
+    up on new rows and edited internships with a few indexed MAX() lookups, and
+    the whole index is rebuilt after SEARCH_INDEX_TTL for anything else.
+    """
+
+    # (field, weight) per indexed model; heavier fields rank higher. An applicant
+    # also matches on the title of the internship it applied for.
+    FIELDS = {
+        'Internship': (('title', 3), ('skills', 2), ('location', 1), ('location_type', 1)),
+        'Applicant': (('full_name', 3), ('email', 2), ('phone', 1), ('internship_title', 1)),
+    }
+
+    INTERNSHIP_COLUMNS = (Internship.id, Internship.title, Internship.skills, Internship.location,
+                          Internship.location_type, Internship.updated_at)
+    APPLICANT_COLUMNS = (Applicant.id, Applicant.internship_id, Applicant.full_name, Applicant.email, Applicant.phone)
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.built = False
+        self.built_at = 0.0
+        self.docs = {}
+        self.postings = {}
+        self.tokens = []
+        self.by_internship = {}
+        # Newest internship id/updated_at and applicant id seen, to catch up from
+        self.synced = (0, None, 0)
+
+    def build(self):
+        with self.lock:
+            if self.built:
+                return
+            self.docs, self.postings, self.tokens, self.by_internship = {}, {}, [], {}
+            self.synced = (0, None, 0)
+            self._catch_up(db.session.query(*self.INTERNSHIP_COLUMNS).all(),
+                           db.session.query(*self.APPLICANT_COLUMNS).all())
+            self.built = True
+            self.built_at = time.monotonic()
+
+    def reset(self):
+        with self.lock:
+            self.built = False
+            self.docs, self.postings, self.tokens, self.by_internship = {}, {}, [], {}
+
+    def refresh(self):
+        """Bring the index up to date with rows committed by other processes"""
+        if time.monotonic() - self.built_at > app.config['SEARCH_INDEX_TTL']:
+            # build() swaps in the new index under the lock, so searches never see it empty
+            self.built = False
+            self.build()
+            return
+        internship_id, internship_updated, applicant_id = self.synced
+        latest = (
+            db.session.query(func.max(Internship.id)).scalar() or 0,
+            db.session.query(func.max(Internship.updated_at)).scalar(),
+            db.session.query(func.max(Applicant.id)).scalar() or 0,
+        )
+        if latest == self.synced:
+            return
+        changed = db.session.query(*self.INTERNSHIP_COLUMNS).filter(db.or_(
+            Internship.id > internship_id,
+            Internship.updated_at > internship_updated if internship_updated else Internship.updated_at.isnot(None),
+        )).all()
+        new_applicants = db.session.query(*self.APPLICANT_COLUMNS).filter(Applicant.id > applicant_id).all()
+        with self.lock:
+            if self.built:
+                self._catch_up(changed, new_applicants)
+
+    def _catch_up(self, internships, applicants):
+        internship_id, internship_updated, applicant_id = self.synced
+        for row in internships:
+            values = row._asdict()
+            updated_at = values.pop('updated_at')
+            self._upsert('Internship', values)
+            internship_id = max(internship_id, row.id)
+            if updated_at is not None and (internship_updated is None or updated_at > internship_updated):
+                internship_updated = updated_at
+        for row in applicants:
+            self._upsert('Applicant', row._asdict())
+            applicant_id = max(applicant_id, row.id)
+        self.synced = (internship_id, internship_updated, applicant_id)
+
+    def apply_changes(self, changes):
+        with self.lock:
+            if not self.built:
+                return
+            for operation, model, values in changes:
+                if model not in self.FIELDS or values.get('id') is None:
+                    continue
+                if operation == 'delete':
+                    self._remove((model, values['id']))
+                else:
+                    self._upsert(model, values)
+
+    def _upsert(self, model, values):
+        key = (model, values['id'])
+        previous = self._remove(key)
+        self._add(model, {**(previous or {}), **values})
+        if model == 'Internship' and (previous or {}).get('title') != self.docs[key].get('title'):
+            # Applicants are indexed under their internship's title too
+            for applicant_key in list(self.by_internship.get(values['id'], ())):
+                self._add('Applicant', self._remove(applicant_key))
+
+    def _add(self, model, values):
+        key = (model, values['id'])
+        if model == 'Applicant':
+            internship = self.docs.get(('Internship', values.get('internship_id')), {})
+            values = {**values, 'internship_title': internship.get('title', '')}
+            self.by_internship.setdefault(values.get('internship_id'), set()).add(key)
+        weights = {}
+        for field, weight in self.FIELDS[model]:
+            text = values.get(field)
+            field_tokens = tokenize(text)
+            if field == 'phone':
+                # Also index the joined digit groups so "9876543210" finds "+91 98765 43210"
+                field_tokens += [''.join(field_tokens[i:]) for i in range(len(field_tokens) - 1)]
+            for token in field_tokens:
+                if token and weight > weights.get(token, 0):
+                    weights[token] = weight
+        fields = dict(self.FIELDS[model])
+        doc = {k: v for k, v in values.items() if k in fields or k in ('id', 'internship_id')}
+        doc['weights'] = weights
+        self.docs[key] = doc
+        for token, weight in weights.items():
+            if token not in self.postings:
+                self.postings[token] = {}
+                bisect.insort(self.tokens, token)
+            self.postings[token][key] = weight
+
+    def _remove(self, key):
+        doc = self.docs.pop(key, None)
+        if doc is None:
+            return None
+        if key[0] == 'Applicant':
+            self.by_internship.get(doc.get('internship_id'), set()).discard(key)
+        for token in doc.pop('weights'):
+            posting = self.postings.get(token)
+            if posting is None:
+                continue
+            posting.pop(key, None)
+            if not posting:
+                del self.postings[token]
+                del self.tokens[bisect.bisect_left(self.tokens, token)]
+        return doc
+
+    def _prefix_matches(self, prefix):
+        """Return {doc_key: score} for every doc holding a token starting with prefix"""
+        matches = {}
+        position = bisect.bisect_left(self.tokens, prefix)
+        while position < len(self.tokens) and self.tokens[position].startswith(prefix):
+            token = self.tokens[position]
+            exact_bonus = 1 if token == prefix else 0
+            for key, weight in self.postings[token].items():
+                score = weight + exact_bonus
+                if score > matches.get(key, 0):
+                    matches[key] = score
+            position += 1
+        return matches
+
+    def search(self, query, limit=SEARCH_LIMIT):
+        """Return up to ``limit`` (model, doc) pairs matching every query token, best first"""
+        self.build()
+        self.refresh()
+        query_tokens = sorted(set(tokenize(query)), key=len, reverse=True)
+        if not query_tokens or limit <= 0:
+            return []
+        with self.lock:
+            # Longest token first: it has the narrowest prefix range to intersect against
+            scores = self._prefix_matches(query_tokens[0])
+            for token in query_tokens[1:]:
+                if not scores:
+                    break
+                matches = self._prefix_matches(token)
+                scores = {key: score + matches[key] for key, score in scores.items() if key in matches}
+            ranked = heapq.nlargest(limit, scores.items(),
+                                    key=lambda item: (item[1], item[0][0] == 'Internship', item[0][1]))
+            return [(key[0], dict(self.docs[key])) for key, score in ranked]
+
+search_index = SearchIndex()
+
+@on_commit
+def update_search_index(changes):
+    search_index.apply_changes(changes)
+
+# ======================= DATABASE SEARCH =======================
+
+class DatabaseSearch:
+    """Admin search pushed down to the database's own full-text index.
+
+    Each serverless instance starts cold, so instead of rebuilding an
+    in-process index the matching runs against an index the database keeps
+    current itself. Subclasses supply the dialect-specific DDL and queries;
+    the DDL runs once, from migration 6, never on process start. Unlike the in-process index, applicants match on name, email and phone
+    only, not on the title of the internship they applied for.
+    """
+
+    SCHEMA = ()
+    INTERNSHIP_SQL = ''
+    APPLICANT_SQL = ''
+
+    def setup(self, connection):
+        """Create the full-text index structures if they are missing"""
+        for statement in self.SCHEMA:
+            connection.execute(db.text(statement))
+
+    def installed(self, connection):
+        """Whether setup() has run against this database (a catalog lookup, no locks taken)"""
+        raise NotImplementedError
+
+    def match_expression(self, tokens):
+        raise NotImplementedError
+
+    def search(self, query, limit=SEARCH_LIMIT):
+        tokens = tokenize(query)
+        if not tokens or limit <= 0:
+            return []
+        params = {'q': self.match_expression(tokens), 'limit': limit}
+        hits = []
+        for model, sql in (('Internship', self.INTERNSHIP_SQL), ('Applicant', self.APPLICANT_SQL)):
+            for row in db.session.execute(db.text(sql), params).mappings():
+                doc = dict(row)
+                hits.append((doc.pop('score'), model == 'Internship', model, doc))
+        ranked = heapq.nlargest(limit, hits, key=lambda hit: (hit[0], hit[1], hit[3]['id']))
+        return [(model, doc) for score, is_internship, model, doc in ranked]
+
+class SQLiteSearch(DatabaseSearch):
+    """FTS5 external-content tables kept in sync by triggers"""
+
+    SCHEMA = (
+        "CREATE VIRTUAL TABLE IF NOT EXISTS internship_fts USING fts5("
+        "title, skills, location, location_type, content='internship', content_rowid='id')",
+        "CREATE TRIGGER IF NOT EXISTS internship_fts_ai AFTER INSERT ON internship BEGIN "
+        "INSERT INTO internship_fts(rowid, title, skills, location, location_type) "
+        "VALUES (new.id, new.title, new.skills, new.location, new.location_type); END",
+        "CREATE TRIGGER IF NOT EXISTS internship_fts_ad AFTER DELETE ON internship BEGIN "
+        "INSERT INTO internship_fts(internship_fts, rowid, title, skills, location, location_type) "
+        "VALUES ('delete', old.id, old.title, old.skills, old.location, old.location_type); END",
+        "CREATE TRIGGER IF NOT EXISTS internship_fts_au AFTER UPDATE ON internship BEGIN "
+        "INSERT INTO internship_fts(internship_fts, rowid, title, skills, location, location_type) "
+        "VALUES ('delete', old.id, old.title, old.skills, old.location, old.location_type); "
+        "INSERT INTO internship_fts(rowid, title, skills, location, location_type) "
+        "VALUES (new.id, new.title, new.skills, new.location, new.location_type); END",
+        "CREATE VIRTUAL TABLE IF NOT EXISTS applicant_fts USING fts5("
+        "full_name, email, phone, content='applicant', content_rowid='id')",
+        "CREATE TRIGGER IF NOT EXISTS applicant_fts_ai AFTER INSERT ON applicant BEGIN "
+        "INSERT INTO applicant_fts(rowid, full_name, email, phone) "
+        "VALUES (new.id, new.full_name, new.email, new.phone); END",
+        "CREATE TRIGGER IF NOT EXISTS applicant_fts_ad AFTER DELETE ON applicant BEGIN "
+        "INSERT INTO applicant_fts(applicant_fts, rowid, full_name, email, phone) "
+        "VALUES ('delete', old.id, old.full_name, old.email, old.phone); END",
+        "CREATE TRIGGER IF NOT EXISTS applicant_fts_au AFTER UPDATE ON applicant BEGIN "
+        "INSERT INTO applicant_fts(applicant_fts, rowid, full_name, email, phone) "
+        "VALUES ('delete', old.id, old.full_name, old.email, old.phone); "
+        "INSERT INTO applicant_fts(rowid, full_name, email, phone) "
+        "VALUES (new.id, new.full_name, new.email, new.phone); END",
+    )
+
+    INTERNSHIP_SQL = (
+        "SELECT i.id, i.title, i.location, i.location_type, "
+        "-bm25(internship_fts, 3.0, 2.0, 1.0, 1.0) AS score "
+        "FROM internship_fts JOIN internship i ON i.id = internship_fts.rowid "
+        "WHERE internship_fts MATCH :q ORDER BY score DESC LIMIT :limit"
+    )
+
+    APPLICANT_SQL = (
+        "SELECT a.id, a.full_name, a.email, i.title AS internship_title, "
+        "-bm25(applicant_fts, 3.0, 2.0, 1.0) AS score "
+        "FROM applicant_fts JOIN applicant a ON a.id = applicant_fts.rowid "
+        "JOIN internship i ON i.id = a.internship_id "
+        "WHERE applicant_fts MATCH :q ORDER BY score DESC LIMIT :limit"
+    )
+
+    TABLES = ('internship_fts', 'applicant_fts')
+
+    def existing_tables(self, connection):
+        return set(connection.execute(db.text(
+            "SELECT name FROM sqlite_master WHERE name IN ('internship_fts', 'applicant_fts')"
+        )).scalars())
+
+    def setup(self, connection):
+        existing = self.existing_tables(connection)
+        super().setup(connection)
+        # External-content tables start empty; backfill rows written before the triggers existed
+        for table in self.TABLES:
+            if table not in existing:
+                connection.execute(db.text(f"INSERT INTO {table}({table}) VALUES ('rebuild')"))
+
+    def installed(self, connection):
+        return self.existing_tables(connection) == set(self.TABLES)
+
+    def match_expression(self, tokens):
+        return ' '.join(f'"{token}"*' for token in tokens)
+
+class PostgresSearch(DatabaseSearch):
+    """Weighted tsvector expressions backed by GIN indexes"""
+
+    INTERNSHIP_VECTOR = (
+        "(setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(skills, '')), 'B') || "
+        "setweight(to_tsvector('simple', coalesce(location, '') || ' ' || coalesce(location_type, '')), 'C'))"
+    )
+
+    APPLICANT_VECTOR = (
+        "(setweight(to_tsvector('simple', coalesce(full_name, '')), 'A') || "
+        "setweight(to_tsvector('simple', regexp_replace(coalesce(email, ''), '[^[:alnum:]]+', ' ', 'g')), 'B') || "
+        "setweight(to_tsvector('simple', regexp_replace(coalesce(phone, ''), '[^[:alnum:]]+', ' ', 'g')), 'C'))"
+    )
+
+    SCHEMA = (
+        f"CREATE INDEX IF NOT EXISTS ix_internship_search ON internship USING GIN ({INTERNSHIP_VECTOR})",
+        f"CREATE INDEX IF NOT EXISTS ix_applicant_search ON applicant USING GIN ({APPLICANT_VECTOR})",
+    )
+
+    # The WHERE clause repeats the indexed expression verbatim so the planner uses the GIN index
+    INTERNSHIP_SQL = (
+        f"SELECT id, title, location, location_type, "
+        f"ts_rank({INTERNSHIP_VECTOR}, to_tsquery('simple', :q)) AS score "
+        f"FROM internship WHERE {INTERNSHIP_VECTOR} @@ to_tsquery('simple', :q) "
+        f"ORDER BY score DESC LIMIT :limit"
+    )
+
+    APPLICANT_SQL = (
+        f"SELECT applicant.id, applicant.full_name, applicant.email, internship.title AS internship_title, "
+        f"ts_rank({APPLICANT_VECTOR}, to_tsquery('simple', :q)) AS score "
+        f"FROM applicant JOIN internship ON internship.id = applicant.internship_id "
+        f"WHERE {APPLICANT_VECTOR} @@ to_tsquery('simple', :q) "
+        f"ORDER BY score DESC LIMIT :limit"
+    )
+
+    def installed(self, connection):
+        return connection.execute(db.text(
+            "SELECT to_regclass('ix_internship_search') IS NOT NULL AND to_regclass('ix_applicant_search') IS NOT NULL"
+        )).scalar()
+
+    def match_expression(self, tokens):
+        return ' & '.join(f"{token}:*" for token in tokens)
+
+DATABASE_SEARCH_BACKENDS = {
+    'sqlite': SQLiteSearch(),
+    'postgresql': PostgresSearch(),
+}
+
+def get_search_backend():
+    """Pick the admin search backend: the database index when enabled, else the in-process index"""
+    if app.config['SEARCH_BACKEND'] == 'database':
+        backend = DATABASE_SEARCH_BACKENDS.get(db.engine.dialect.name)
+        if backend is not None:
+            return backend
+    return search_index
+
+def check_search_schema():
+    """Fall back to the in-memory index when the database full-text index is missing"""
+    backend = get_search_backend()
+    if backend is search_index:
+        return
+    try:
+        with db.engine.connect() as connection:
+            installed = backend.installed(connection)
     except Exception as e:
-        print(f"Error getting site settings: {e}")
-        # Return default settings object without saving to DB
-        return SiteSettings(
-            company_name='Shramic',
-            tagline='Empowering Careers Through Excellence'
+        print(f"Full-text search check failed: {e}")
+        installed = False
+    if not installed:
+        print("Full-text search index missing (see migration 6), using in-memory index")
+        app.config['SEARCH_BACKEND'] = 'memory'
+
+# ======================= DASHBOARD STATS =======================
+
+_stats_cache = {'snapshot': None, 'expires': 0.0}
+_stats_lock = threading.Lock()
+
+def compute_dashboard_stats():
+    """Compute every dashboard counter with one aggregate query per table"""
+    total_internships, active_internships = db.session.query(
+        func.count(Internship.id),
+        func.count(case((Internship.is_active.is_(True), 1)))
+    ).one()
+    total_applicants, pending_applicants = db.session.query(
+        func.count(Applicant.id),
+        func.count(case((Applicant.status == 'pending', 1)))
+    ).one()
+    total_messages, unread_messages = db.session.query(
+        func.count(ContactMessage.id),
+        func.count(case((ContactMessage.is_read.is_(False), 1)))
+    ).one()
+    return {
+        'total_internships': total_internships,
+        'active_internships': active_internships,
+        'total_applicants': total_applicants,
+        'pending_applicants': pending_applicants,
+        'total_messages': total_messages,
+        'unread_messages': unread_messages,
+    }
+
+def get_dashboard_stats():
+    """Return the cached stats snapshot, recomputing it once STATS_CACHE_TTL has passed"""
+    with _stats_lock:
+        snapshot = _stats_cache['snapshot']
+        if snapshot is not None and time.monotonic() < _stats_cache['expires']:
+            return snapshot
+    snapshot = compute_dashboard_stats()
+    with _stats_lock:
+        _stats_cache['snapshot'] = snapshot
+        _stats_cache['expires'] = time.monotonic() + app.config['STATS_CACHE_TTL']
+    return snapshot
+
+@on_commit
+def invalidate_dashboard_stats(changes):
+    if any(model in ('Internship', 'Applicant', 'ContactMessage') for operation, model, values in changes):
+        with _stats_lock:
+            _stats_cache['snapshot'] = None
+
+# ======================= RESUME STORAGE =======================
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+CONTENT_ADDRESSED_NAME = re.compile(r'^[0-9a-f]{64}\.\w+$')
+
+_resume_etags = {}
+
+def resume_etag(name, path):
+    """Strong ETag for a resume: the content hash, which content-addressed blobs carry in their name"""
+    if CONTENT_ADDRESSED_NAME.match(name):
+        return name.split('.', 1)[0]
+    # Older timestamp-named uploads: hash once per (mtime, size) and remember it
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    etag = _resume_etags.get(key)
+    if etag is None:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(UPLOAD_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        etag = _resume_etags[key] = digest.hexdigest()
+    return etag
+
+class FilesystemStorage:
+    """Resume blobs in a local directory, served by the app itself"""
+
+    def __init__(self, root):
+        os.makedirs(root, exist_ok=True)
+        self.root = root
+        self.staging_dir = root  # same filesystem, so storing a staged upload is a rename
+
+    def path(self, name):
+        return os.path.join(self.root, name)
+
+    def exists(self, name):
+        return os.path.exists(self.path(name))
+
+    def save(self, name, staged_path):
+        os.replace(staged_path, self.path(name))
+
+    def delete(self, name):
+        if self.exists(name):
+            os.remove(self.path(name))
+
+    def response(self, name):
+        """Serve a resume with a strong ETag, 304s, byte ranges and long-lived private caching.
+
+        With RESUME_OFFLOAD set, the bytes are handed to the front proxy via
+        X-Sendfile (Apache/lighttpd) or X-Accel-Redirect (nginx) instead.
+        """
+        path = safe_join(self.root, name)
+        if path is None or not os.path.isfile(path):
+            abort(404)
+        etag = resume_etag(name, path)
+        offload = app.config['RESUME_OFFLOAD']
+        if offload == 'x-accel-redirect':
+            if request.if_none_match.contains(etag):
+                response = Response(status=304)
+            else:
+                response = Response(mimetype=mimetypes.guess_type(name)[0] or 'application/octet-stream')
+                response.headers['X-Accel-Redirect'] = app.config['RESUME_ACCEL_PREFIX'] + name
+            response.set_etag(etag)
+        else:
+            response = werkzeug_send_file(path, request.environ, conditional=True, etag=etag,
+                                          max_age=app.config['RESUME_CACHE_MAX_AGE'],
+                                          use_x_sendfile=offload == 'x-sendfile')
+            response.accept_ranges = 'bytes'
+        # Resumes are personal data: cacheable by the admin's browser, never by shared caches
+        response.cache_control.public = False
+        response.cache_control.private = True
+        response.cache_control.max_age = app.config['RESUME_CACHE_MAX_AGE']
+        if CONTENT_ADDRESSED_NAME.match(name):
+            response.cache_control.immutable = True
+        return response
+
+class S3Storage:
+    """Resume blobs in an S3-compatible bucket (AWS S3, MinIO, R2...).
+
+    Large uploads go up as concurrent multipart uploads, and downloads redirect
+    to a short-lived pre-signed URL so the bytes never pass through Python.
+    Point S3_ENDPOINT_URL at a local MinIO to run against a stand-in.
+    """
+
+    MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+
+    def __init__(self, bucket, prefix='', endpoint_url=None, region=None, presign_expires=300):
+        self.bucket = bucket
+        self.prefix = prefix
+        self.endpoint_url = endpoint_url
+        self.region = region
+        self.presign_expires = presign_expires
+        self.staging_dir = tempfile.gettempdir()
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            try:
+                import boto3
+                from botocore.config import Config
+            except ImportError:
+                raise RuntimeError('RESUME_STORAGE=s3 requires boto3 (pip install boto3)')
+            self._client = boto3.client(
+                's3',
+                endpoint_url=self.endpoint_url,
+                region_name=self.region,
+                config=Config(signature_version='s3v4', s3={'addressing_style': 'path' if self.endpoint_url else 'auto'})
+            )
+        return self._client
+
+    def key(self, name):
+        return f"{self.prefix}{name}"
+
+    def exists(self, name):
+        from botocore.exceptions import ClientError
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self.key(name))
+            return True
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            raise
+
+    def save(self, name, staged_path):
+        from boto3.s3.transfer import TransferConfig
+        transfer = TransferConfig(multipart_threshold=self.MULTIPART_CHUNK_SIZE,
+                                  multipart_chunksize=self.MULTIPART_CHUNK_SIZE)
+        content_type = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+        try:
+            self.client.upload_file(staged_path, self.bucket, self.key(name),
+                                    ExtraArgs={'ContentType': content_type}, Config=transfer)
+        finally:
+            os.remove(staged_path)
+
+    def delete(self, name):
+        self.client.delete_object(Bucket=self.bucket, Key=self.key(name))
+
+    def url(self, name):
+        return self.client.generate_presigned_url(
+            'get_object',
+            Params={'Bucket': self.bucket, 'Key': self.key(name),
+                    'ResponseContentDisposition': f'inline; filename="{name}"'},
+            ExpiresIn=self.presign_expires
         )
 
+    def response(self, name):
+        return redirect(self.url(name))
+
+_resume_storage = None
+
+def get_resume_storage():
+    """Return the storage backend selected by RESUME_STORAGE ('filesystem' or 's3')"""
+    global _resume_storage
+    if _resume_storage is None:
+        if app.config['RESUME_STORAGE'] == 's3':
+            _resume_storage = S3Storage(
+                bucket=app.config['S3_BUCKET'],
+                prefix=app.config['S3_PREFIX'],
+                endpoint_url=app.config['S3_ENDPOINT_URL'],
+                region=app.config['S3_REGION'],
+                presign_expires=app.config['S3_PRESIGN_EXPIRES']
+            )
+        else:
+            _resume_storage = FilesystemStorage(app.config['UPLOAD_FOLDER'])
+    return _resume_storage
+
+# ======================= RESUME UPLOADS =======================
+
+class HashingFileStream:
+    """Upload container that writes straight to disk and hashes bytes as they arrive.
+
+    Werkzeug's form parser writes each multipart chunk into it, so the SHA-256
+    of the resume is known as soon as parsing finishes, without buffering the
+    file in memory or reading it back a second time.
+    """
+
+    def __init__(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        self.file = tempfile.NamedTemporaryFile(dir=directory, prefix='.upload-', delete=False)
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data):
+        self.sha256.update(data)
+        self.size += len(data)
+        return self.file.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self.file, name)
+
+    def discard(self):
+        self.file.close()
+        if os.path.exists(self.file.name):
+            os.remove(self.file.name)
+
+class UploadRequest(Request):
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        stream = HashingFileStream(get_resume_storage().staging_dir)
+        self.__dict__.setdefault('upload_streams', []).append(stream)
+        return stream
+
+app.request_class = UploadRequest
+
+@app.teardown_request
+def discard_upload_streams(exc):
+    # Anything still in a temp file was never stored (validation failed or the request errored)
+    for stream in request.__dict__.get('upload_streams', ()):
+        stream.discard()
+
+def store_resume(file):
+    """Store an uploaded resume as a content-addressed blob and return its name.
+
+    Blobs are named <sha256>.<ext>, so the same file submitted to several
+    internships is kept once and shared by every Applicant.resume_path.
+    """
+    storage = get_resume_storage()
+    extension = file.filename.rsplit('.', 1)[1].lower()
+    stream = file.stream
+    if not isinstance(stream, HashingFileStream):
+        stream = HashingFileStream(storage.staging_dir)
+        for chunk in iter(lambda: file.stream.read(UPLOAD_CHUNK_SIZE), b''):
+            stream.write(chunk)
+    stream.file.close()
+    name = f"{stream.sha256.hexdigest()}.{extension}"
+    if storage.exists(name):
+        stream.discard()
+    else:
+        storage.save(name, stream.file.name)
+    return name
+
+def release_resumes(paths):
+    """Delete resume blobs that no applicant references any more"""
+    storage = get_resume_storage()
+    with db.engine.connect() as connection:
+        for path in paths:
+            in_use = connection.execute(
+                db.select(Applicant.id).where(Applicant.resume_path == path).limit(1)
+            ).first()
+            if in_use is None:
+                storage.delete(path)
+
+@on_commit
+def release_deleted_resumes(changes):
+    paths = {values['resume_path'] for operation, model, values in changes
+             if model == 'Applicant' and operation == 'delete' and values.get('resume_path')}
+    if paths:
+        release_resumes(paths)
+
+# ======================= EMAIL RENDERING =======================
+
+# Context keys that differ per recipient, and the fields templates may print from them
+EMAIL_RECIPIENT_FIELDS = {
+    'applicant': ('full_name', 'email'),
+    'recipient': ('full_name', 'email'),
+}
+
+PLACEHOLDER_PATTERN = re.compile('\x00(\\w+)\\.(\\w+)\x00')
+
+_email_templates = {}
+_prerendered_emails = OrderedDict()
+_prerendered_lock = threading.Lock()
+
+class Placeholder:
+    """Stands in for a recipient while rendering, printing a marker for each allowed field"""
+
+    def __init__(self, key, fields):
+        self._key = key
+        self._fields = fields
+        self.unknown = set()
+
+    def __getattr__(self, name):
+        if name.startswith('_') or name == 'unknown':
+            raise AttributeError(name)
+        if name in self._fields:
+            return f'\x00{self._key}.{name}\x00'
+        self.unknown.add(name)
+        raise AttributeError(name)
+
+def get_email_template(name):
+    """Compile each email template once per process"""
+    template = _email_templates.get(name)
+    if template is None:
+        template = _email_templates[name] = app.jinja_env.get_template(name)
+    return template
+
+class PrerenderedEmail:
+    """An email template rendered once with placeholders for the per-recipient fields.
+
+    render() only splices each recipient's escaped values into the pre-rendered
+    parts. If the template does anything with a placeholder besides printing it
+    (filters, slicing, fields outside EMAIL_RECIPIENT_FIELDS), the splice can't
+    be trusted and every render falls back to a full Jinja render instead.
+    """
+
+    def __init__(self, template_name, shared, recipient_keys):
+        self.template = get_email_template(template_name)
+        self.shared = shared
+        placeholders = {key: Placeholder(key, EMAIL_RECIPIENT_FIELDS[key]) for key in recipient_keys}
+        html = self.template.render(**shared, **placeholders)
+        self.parts = PLACEHOLDER_PATTERN.split(html)
+        markers = len(self.parts) // 3
+        if any(placeholder.unknown for placeholder in placeholders.values()) or html.count('\x00') != 2 * markers:
+            self.parts = None
+        # A case-changing filter still yields a well-formed marker, just not one of ours
+        elif any(self.parts[i] not in placeholders or self.parts[i + 1] not in EMAIL_RECIPIENT_FIELDS[self.parts[i]]
+                 for i in range(1, len(self.parts), 3)):
+            self.parts = None
+
+    def render(self, **recipients):
+        if self.parts is None:
+            return self.template.render(**self.shared, **recipients)
+        out = [self.parts[0]]
+        for i in range(1, len(self.parts), 3):
+            value = getattr(recipients[self.parts[i]], self.parts[i + 1])
+            out.append(str(escape(value if value is not None else '')))
+            out.append(self.parts[i + 2])
+        return ''.join(out)
+
+def get_prerendered_email(key, build):
+    """Return the cached PrerenderedEmail for key, calling build() to create it on a miss"""
+    with _prerendered_lock:
+        prerendered = _prerendered_emails.get(key)
+        if prerendered is not None:
+            _prerendered_emails.move_to_end(key)
+            return prerendered
+    prerendered = build()
+    with _prerendered_lock:
+        _prerendered_emails[key] = prerendered
+        while len(_prerendered_emails) > 256:
+            _prerendered_emails.popitem(last=False)
+    return prerendered
+
+@on_commit
+def invalidate_prerendered_emails(changes):
+    # Shared parts embed internship details; the updated_at in the cache key covers edits made
+    # elsewhere, this just drops this process's stale entries right away
+    if any(model == 'Internship' for operation, model, values in changes):
+        with _prerendered_lock:
+            _prerendered_emails.clear()
+
+# ======================= EMAIL OUTBOX =======================
+
+# Context keys that name a model are stored as ids and loaded again at render time
+EMAIL_CONTEXT_MODELS = {
+    'applicant': Applicant,
+    'internship': Internship,
+    'recipient': Applicant,
+}
+
+_outbox_executor = None
+_outbox_executor_lock = threading.Lock()
+
+class RateLimiter:
+    """Spaces sends evenly so every worker in this process together stays under MAIL_RATE_LIMIT per second"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.next_slot = 0.0
+
+    def wait(self):
+        rate = app.config['MAIL_RATE_LIMIT']
+        if rate <= 0:
+            return
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + 1.0 / rate
+        if slot > now:
+            time.sleep(slot - now)
+
+mail_rate_limiter = RateLimiter()
+
+def queue_email(recipient, subject, template, **context):
+    """Add an email to the outbox in the caller's transaction; it is sent after commit"""
+    stored = {key: value.id if key in EMAIL_CONTEXT_MODELS else value for key, value in context.items()}
+    entry = EmailOutbox(
+        recipient=recipient,
+        subject=subject,
+        template=template,
+        context=json.dumps(stored),
+        base_url=request.url_root if has_request_context() else None
+    )
+    db.session.add(entry)
+    return entry
+
+def queue_campaign(subject, message_body, recipients):
+    """Create a campaign with one outbox row per (applicant_id, email) recipient, inserted in bulk"""
+    campaign = EmailCampaign(subject=subject, message_body=message_body, total=0)
+    db.session.add(campaign)
+    db.session.flush()
+    add_campaign_recipients(campaign, recipients)
+    return campaign
+
+def add_campaign_recipients(campaign, recipients):
+    """Queue one more outbox row per (applicant_id, email) recipient of an existing campaign"""
+    campaign.total = (campaign.total or 0) + len(recipients)
+    base_url = request.url_root if has_request_context() else None
+    if recipients:
+        db.session.execute(db.insert(EmailOutbox), [{
+            'recipient': email,
+            'subject': campaign.subject,
+            'template': 'emails/custom_email.html',
+            'context': json.dumps({'recipient': applicant_id}),
+            'base_url': base_url,
+            'campaign_id': campaign.id,
+        } for applicant_id, email in recipients])
+
+def shared_context_versions(shared_ids):
+    """updated_at of every shared model that has one, so an edit made by another worker or
+    instance changes the prerender cache key instead of waiting for LRU eviction"""
+    versions = []
+    for key, value in sorted(shared_ids.items()):
+        model = EMAIL_CONTEXT_MODELS.get(key)
+        if model is not None and hasattr(model, 'updated_at'):
+            updated_at = db.session.query(model.updated_at).filter(model.id == value).scalar()
+            versions.append((key, updated_at.isoformat() if updated_at else None))
+    return tuple(versions)
+
+def render_outbox_email(entry):
+    """Render an outbox entry, reusing the shared parts rendered for its campaign or internship"""
+    context = json.loads(entry.context or '{}')
+    recipient_keys = sorted(key for key in context if key in EMAIL_RECIPIENT_FIELDS)
+    settings = get_site_settings()
+    shared_ids = {key: value for key, value in context.items() if key not in EMAIL_RECIPIENT_FIELDS}
+    cache_key = (entry.template, entry.base_url, entry.campaign_id, site_settings_version(settings),
+                 json.dumps(shared_ids, sort_keys=True), shared_context_versions(shared_ids))
+
+    def load(values):
+        return {key: db.session.get(EMAIL_CONTEXT_MODELS[key], value) if key in EMAIL_CONTEXT_MODELS else value
+                for key, value in values.items()}
+
+    def build():
+        shared = load(shared_ids)
+        shared['settings'] = settings
+        if entry.campaign is not None:
+            shared['message_body'] = entry.campaign.message_body
+        return PrerenderedEmail(entry.template, shared, recipient_keys)
+
+    # Templates build absolute links with url_for(_external=True), which needs a request
+    with app.test_request_context('/', base_url=entry.base_url or 'http://localhost/'):
+        prerendered = get_prerendered_email(cache_key, build)
+        return prerendered.render(**load({key: context[key] for key in recipient_keys}))
+
+def claim_outbox_batch(limit, campaign_id=None, lease_seconds=600):
+    """Lease up to ``limit`` due entries to this worker with a single UPDATE and return them.
+
+    The due conditions are repeated on the UPDATE itself, so when two workers
+    race for the same rows the database lets only one of them take each row.
+    Entries whose lease runs out (a crashed worker) become due again.
+    """
+    now = datetime.utcnow()
+    token = secrets.token_hex(8)
+    due = db.and_(EmailOutbox.status.in_(['pending', 'sending']), EmailOutbox.next_attempt_at <= now)
+    if campaign_id is not None:
+        due = db.and_(due, EmailOutbox.campaign_id == campaign_id)
+    batch = db.select(EmailOutbox.id).where(due).order_by(EmailOutbox.id).limit(limit)
+    db.session.execute(
+        db.update(EmailOutbox)
+        .where(due, EmailOutbox.id.in_(batch))
+        .values(status='sending', claim_token=token, next_attempt_at=now + timedelta(seconds=lease_seconds))
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+    return EmailOutbox.query.filter_by(claim_token=token).order_by(EmailOutbox.id).all()
+
+def record_outbox_result(entry, error=None):
+    entry.attempts = (entry.attempts or 0) + 1
+    entry.claim_token = None
+    if error is None:
+        entry.status = 'sent'
+        entry.sent_at = datetime.utcnow()
+        entry.last_error = None
+    elif entry.attempts >= app.config['OUTBOX_MAX_ATTEMPTS']:
+        entry.status = 'failed'
+        entry.last_error = error
+    else:
+        entry.status = 'pending'
+        entry.last_error = error
+        entry.next_attempt_at = datetime.utcnow() + timedelta(seconds=30 * 2 ** entry.attempts)
+
+_mail = None
+
+def get_mail():
+    """Flask-Mail, set up on the first send so smtplib/email stay off the cold-start path"""
+    global _mail
+    if _mail is None:
+        from flask_mail import Mail
+        _mail = Mail(app)
+    return _mail
+
+def release_outbox_entries(entries):
+    """Hand claimed but unsent entries back to the queue without counting an attempt"""
+    now = datetime.utcnow()
+    for entry in entries:
+        entry.status = 'pending'
+        entry.claim_token = None
+        entry.next_attempt_at = now
+    db.session.commit()
+
+def send_outbox_batch(batch, deadline=None):
+    """Send a claimed batch over one SMTP connection, committing each result as it lands.
+
+    Entries still unsent when ``deadline`` (a time.monotonic() value) passes are
+    released for the next drain.
+    """
+    from flask_mail import Message
+    import smtplib
+    sent = failed = 0
+    pending = list(batch)
+    try:
+        with get_mail().connect() as connection:
+            while pending:
+                if deadline is not None and time.monotonic() >= deadline:
+                    release_outbox_entries(pending)
+                    return sent, failed
+                entry = pending[0]
+                try:
+                    msg = Message(entry.subject, recipients=[entry.recipient])
+                    msg.html = render_outbox_email(entry)
+                    mail_rate_limiter.wait()
+                    started = time.perf_counter()
+                    connection.send(msg)
+                    record_smtp_time(time.perf_counter() - started)
+                    record_outbox_result(entry)
+                    sent += 1
+                except smtplib.SMTPServerDisconnected:
+                    raise
+                except Exception as e:
+                    print(f"Email error: {e}")
+                    record_outbox_result(entry, error=str(e))
+                    failed += 1
+                # Commit per message so a timeout or crash cannot lose (and later resend) delivered mail
+                db.session.commit()
+                pending.pop(0)
+    except Exception as e:
+        # The SMTP connection itself failed: every entry not yet sent is retried later
+        print(f"Email error: {e}")
+        for entry in pending:
+            record_outbox_result(entry, error=str(e))
+            failed += 1
+        db.session.commit()
+    return sent, failed
+
+def drain_outbox(campaign_id=None, time_limit=None):
+    """Send due outbox emails in MAIL_BATCH_SIZE batches; returns (sent, failed) counts.
+
+    With ``time_limit`` (seconds) no new message is started once it runs out, so a
+    serverless invocation returns before the platform kills it mid-batch.
+    """
+    deadline = time.monotonic() + time_limit if time_limit else None
+    sent = failed = 0
+    while deadline is None or time.monotonic() < deadline:
+        batch = claim_outbox_batch(app.config['MAIL_BATCH_SIZE'], campaign_id=campaign_id)
+        if not batch:
+            break
+        batch_sent, batch_failed = send_outbox_batch(batch, deadline=deadline)
+        sent += batch_sent
+        failed += batch_failed
+    return sent, failed
+
+def run_outbox_worker(campaign_id=None):
+    with app.app_context():
+        try:
+            drain_outbox(campaign_id=campaign_id)
+        except Exception as e:
+            print(f"Outbox worker error: {e}")
+
+def kick_outbox(workers=1, campaign_id=None):
+    """Start ``workers`` background drains when running in thread mode.
+
+    In queue mode (serverless, where threads die with the response) entries wait
+    for /tasks/outbox/drain or `flask drain-outbox` instead.
+    """
+    global _outbox_executor
+    if app.config['OUTBOX_MODE'] != 'thread':
+        return
+    with _outbox_executor_lock:
+        if _outbox_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            _outbox_executor = ThreadPoolExecutor(max_workers=app.config['OUTBOX_WORKERS'],
+                                                  thread_name_prefix='outbox')
+    for _ in range(workers):
+        _outbox_executor.submit(run_outbox_worker, campaign_id)
+
+def campaign_status(campaign):
+    """Per-status recipient counts for a campaign, from one GROUP BY query"""
+    counts = dict(db.session.query(EmailOutbox.status, func.count(EmailOutbox.id))
+                  .filter(EmailOutbox.campaign_id == campaign.id)
+                  .group_by(EmailOutbox.status).all())
+    in_flight = counts.get('pending', 0) + counts.get('sending', 0)
+    return {
+        'id': campaign.id,
+        'subject': campaign.subject,
+        'total': campaign.total,
+        'sent': counts.get('sent', 0),
+        'failed': counts.get('failed', 0),
+        'pending': in_flight,
+        'status': 'sending' if in_flight else 'completed',
+        'created_at': campaign.created_at.isoformat() if campaign.created_at else None,
+    }
+
+@app.cli.command('drain-outbox')
+def drain_outbox_command():
+    """Send every due email in the outbox."""
+    sent, failed = drain_outbox()
+    print(f"Outbox drained: {sent} sent, {failed} failed")
+
+# ======================= BULK STATUS UPDATES =======================
+
+APPLICANT_STATUSES = ('pending', 'reviewed', 'shortlisted', 'rejected')
+
+# Default notification per new status; message_body goes through custom_email.html
+STATUS_NOTIFICATIONS = {
+    'pending': ('Your application status', '<p>Your application is back in our review queue. We will be in touch soon.</p>'),
+    'reviewed': ('Your application has been reviewed', '<p>Our team has reviewed your application. We will contact you about next steps.</p>'),
+    'shortlisted': ('You have been shortlisted!', '<p>Congratulations, you have been shortlisted! We will reach out shortly to schedule the next round.</p>'),
+    'rejected': ('Update on your application', '<p>Thank you for applying. After careful review we will not be moving forward with your application this time.</p>'),
+}
+
+def applicant_filters(internship_id=None, status=None, applied_from=None, applied_to=None):
+    """WHERE clauses for a bulk selection; applied_to is an inclusive date"""
+    conditions = []
+    if internship_id:
+        conditions.append(Applicant.internship_id == internship_id)
+    if status and status != 'all':
+        conditions.append(Applicant.status == status)
+    if applied_from:
+        conditions.append(Applicant.applied_at >= applied_from)
+    if applied_to:
+        conditions.append(Applicant.applied_at < applied_to + timedelta(days=1))
+    return conditions
+
+def bulk_update_status(new_status, ids=None, conditions=(), notify=False, subject=None, message=None,
+                       chunk_size=None):
+    """Move every selected applicant to ``new_status``; returns the affected counts.
+
+    The selection is ``ids`` and/or ``conditions``. It is walked in id order,
+    ``chunk_size`` applicants at a time, with one set-based UPDATE and one
+    commit per chunk so a large selection never holds a long transaction.
+    Applicants already in ``new_status`` are counted but not touched, and with
+    ``notify`` only the ones that actually changed get an email, queued in the
+    same transaction as their update as one campaign.
+    """
+    if new_status not in APPLICANT_STATUSES:
+        raise ValueError(f"Unknown status: {new_status}")
+    if ids is None and not conditions:
+        raise ValueError('Select applicants by id or by at least one filter')
+    chunk_size = chunk_size or app.config['BULK_UPDATE_CHUNK_SIZE']
+    remaining = sorted({int(applicant_id) for applicant_id in ids}) if ids is not None else None
+    result = {'status': new_status, 'matched': 0, 'updated': 0, 'unchanged': 0, 'chunks': 0,
+              'notified': 0, 'campaign_id': None}
+    campaign = None
+    last_id = 0
+    while True:
+        chunk_conditions = [*conditions, Applicant.id > last_id]
+        if remaining is not None:
+            if not remaining:
+                break
+            chunk_conditions.append(Applicant.id.in_(remaining[:chunk_size]))
+            remaining = remaining[chunk_size:]
+        rows = db.session.execute(
+            db.select(Applicant.id, Applicant.email, Applicant.status)
+            .where(*chunk_conditions).order_by(Applicant.id).limit(chunk_size)
+        ).all()
+        if not rows:
+            if remaining is None:
+                break
+            continue
+        last_id = rows[-1].id
+        changing = [(row.id, row.email) for row in rows if row.status != new_status]
+        result['matched'] += len(rows)
+        result['unchanged'] += len(rows) - len(changing)
+        if not changing:
+            continue
+
+        updated = db.session.execute(
+            db.update(Applicant)
+            .where(Applicant.id.in_([applicant_id for applicant_id, _ in changing]), Applicant.status != new_status)
+            .values(status=new_status)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if notify:
+            if campaign is None:
+                default_subject, default_message = STATUS_NOTIFICATIONS[new_status]
+                campaign = EmailCampaign(subject=subject or default_subject,
+                                         message_body=message or default_message, total=0)
+                db.session.add(campaign)
+                db.session.flush()
+            add_campaign_recipients(campaign, changing)
+            result['notified'] += len(changing)
+        # Core UPDATEs skip the flush hooks, so hand the commit listeners the changes directly
+        db.session.info.setdefault('committed_changes', []).extend(
+            ('update', 'Applicant', {'id': applicant_id, 'status': new_status}) for applicant_id, _ in changing)
+        db.session.commit()
+        result['updated'] += updated
+        result['chunks'] += 1
+
+    if campaign is not None:
+        result['campaign_id'] = campaign.id
+        kick_outbox(workers=app.config['OUTBOX_WORKERS'], campaign_id=campaign.id)
+    return result
+
+# ======================= APPLICANT EXPORT =======================
+
+EXPORT_COLUMNS = (
+    ('ID', Applicant.id),
+    ('Full Name', Applicant.full_name),
+    ('Email', Applicant.email),
+    ('Phone', Applicant.phone),
+    ('Internship', Internship.title),
+    ('Location', Internship.location),
+    ('Status', Applicant.status),
+    ('Applied At', Applicant.applied_at),
+    ('LinkedIn', Applicant.linkedin_url),
+    ('Portfolio', Applicant.portfolio_url),
+    ('Resume', Applicant.resume_path),
+    ('Cover Letter', Applicant.cover_letter),
+    ('Additional Info', Applicant.additional_info),
+)
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'xlsx': ('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'xlsx'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+}
+
+# Characters XML 1.0 cannot carry at all; dropped from XLSX cells
+XML_ILLEGAL_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+def export_rows(conditions):
+    """Yield plain export tuples newest first, streamed from a server-side cursor in EXPORT_BATCH_SIZE batches"""
+    statement = (
+        db.select(*(column for _, column in EXPORT_COLUMNS))
+        .join(Internship, Applicant.internship_id == Internship.id)
+        .where(*conditions)
+        .order_by(Applicant.applied_at.desc(), Applicant.id.desc())
+        .execution_options(yield_per=app.config['EXPORT_BATCH_SIZE'])
+    )
+    for partition in db.session.execute(statement).partitions():
+        yield from partition
+
+def export_value(value):
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    return '' if value is None else value
+
+# Phone numbers ("+91 98765 43210") and plain numbers: no cell references or functions to abuse
+PLAIN_NUMBER_PATTERN = re.compile(r'[+-]?[\d\s().-]+')
+
+def spreadsheet_text(value):
+    """Neutralise cells a spreadsheet would otherwise evaluate as a formula"""
+    if isinstance(value, str) and value[:1] in ('=', '+', '-', '@', '\t', '\r') \
+            and not PLAIN_NUMBER_PATTERN.fullmatch(value):
+        return "'" + value
+    return value
+
+def stream_csv(rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # BOM so Excel opens the file as UTF-8
+    buffer.write('\ufeff')
+    writer.writerow([header for header, _ in EXPORT_COLUMNS])
+    for count, row in enumerate(rows, 1):
+        writer.writerow([spreadsheet_text(export_value(value)) for value in row])
+        if count % 500 == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+def stream_ndjson(rows):
+    keys = [header.lower().replace(' ', '_') for header, _ in EXPORT_COLUMNS]
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(dict(zip(keys, row)), default=export_value))
+        if len(lines) == 500:
+            yield '\n'.join(lines) + '\n'
+            lines = []
+    if lines:
+        yield '\n'.join(lines) + '\n'
+
+class ZipStream:
+    """Write-only, unseekable file object that hands whatever ZipFile wrote so far to a generator"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self):
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+XLSX_PARTS = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="xl/workbook.xml" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+        '</Relationships>'),
+    'xl/workbook.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Applicants" sheetId="1" r:id="rId1"/></sheets></workbook>'),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="worksheets/sheet1.xml" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"/>'
+        '</Relationships>'),
+}
+
+def xlsx_row(values):
+    cells = []
+    for value in values:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            cells.append(f'<c t="n"><v>{value}</v></c>')
+        else:
+            text = escape(XML_ILLEGAL_CHARS.sub('', str(export_value(value))))
+            cells.append(f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>')
+    return '<row>' + ''.join(cells) + '</row>'
+
+def stream_xlsx(rows):
+    """Build a one-sheet workbook on the fly: the sheet XML is deflated into the zip as rows arrive"""
+    output = ZipStream()
+    with zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, content in XLSX_PARTS.items():
+            archive.writestr(name, content)
+        yield output.take()
+        with archive.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+            sheet.write(b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                        b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>')
+            sheet.write(xlsx_row([header for header, _ in EXPORT_COLUMNS]).encode())
+            batch = []
+            for row in rows:
+                batch.append(xlsx_row(row))
+                if len(batch) == 500:
+                    sheet.write(''.join(batch).encode())
+                    batch = []
+                    yield output.take()
+            sheet.write(''.join(batch).encode() + b'</sheetData></worksheet>')
+    yield output.take()
+
+EXPORT_WRITERS = {'csv': stream_csv, 'xlsx': stream_xlsx, 'ndjson': stream_ndjson}
+
+# ======================= PAGE CACHE =======================
+
+class MemoryPageCache:
+    """Per-process LRU of rendered pages"""
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, page, ttl):
+        with self.lock:
+            self.entries[key] = (time.time() + ttl, page)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+def encode_page(page, expires):
+    meta = {'expires': expires, 'status': page['status'], 'headers': page['headers']}
+    return json.dumps(meta).encode() + b'\n' + page['body']
+
+def decode_page(data):
+    meta, body = data.split(b'\n', 1)
+    meta = json.loads(meta)
+    return meta, {'status': meta['status'], 'headers': meta['headers'], 'body': body}
+
+class FilesystemPageCache:
+    """Rendered pages as files, shared by every worker process on the host"""
+
+    def __init__(self, directory):
+        # Cached pages are served verbatim, so the directory must not be writable by anyone else
+        self.directory = private_directory(directory)
+
+    def path(self, key):
+        return os.path.join(self.directory, hashlib.sha1(key.encode()).hexdigest())
+
+    def get(self, key):
+        try:
+            with open(self.path(key), 'rb') as f:
+                meta, page = decode_page(f.read())
+        except (OSError, ValueError):
+            return None
+        return page if meta['expires'] > time.time() else None
+
+    def set(self, key, page, ttl):
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        # Write then rename so concurrent readers never see a half-written page
+        with tempfile.NamedTemporaryFile(dir=self.directory, delete=False) as f:
+            f.write(encode_page(page, time.time() + ttl))
+        os.replace(f.name, self.path(key))
+
+    def clear(self):
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+class RedisPageCache:
+    """Rendered pages in Redis (or anything speaking its protocol), shared by every instance.
+
+    Keys carry a generation number, so clearing the cache is a single INCR and
+    stale pages simply age out through their TTL.
+    """
+
+    def __init__(self, url, prefix='shramic:page:'):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError('PAGE_CACHE_BACKEND=redis requires redis (pip install redis)')
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def key(self, key):
+        generation = int(self.client.get(self.prefix + 'generation') or 0)
+        return f"{self.prefix}{generation}:{hashlib.sha1(key.encode()).hexdigest()}"
+
+    def get(self, key):
+        data = self.client.get(self.key(key))
+        return decode_page(data)[1] if data else None
+
+    def set(self, key, page, ttl):
+        self.client.set(self.key(key), encode_page(page, time.time() + ttl), ex=ttl)
+
+    def clear(self):
+        self.client.incr(self.prefix + 'generation')
+
+_page_cache = None
+
+def get_page_cache():
+    """Return the backend selected by PAGE_CACHE_BACKEND, or None when page caching is off"""
+    global _page_cache
+    backend = app.config['PAGE_CACHE_BACKEND']
+    if backend == 'none':
+        return None
+    if _page_cache is None:
+        if backend == 'redis':
+            _page_cache = RedisPageCache(app.config['REDIS_URL'])
+        elif backend == 'filesystem':
+            try:
+                _page_cache = FilesystemPageCache(app.config['PAGE_CACHE_DIR'])
+            except OSError as e:
+                print(f"Filesystem page cache unavailable, using memory: {e}")
+                _page_cache = MemoryPageCache()
+        else:
+            _page_cache = MemoryPageCache()
+    return _page_cache
+
+def invalidate_page_cache():
+    """Drop this process's (or the shared backend's) cached pages after an admin edit.
+
+    Other processes don't need this to stay correct, since their keys carry the
+    conditional ETag; it only frees entries that can no longer be hit.
+    """
+    cache = get_page_cache()
+    if cache is None:
+        return
+    try:
+        cache.clear()
+    except Exception as e:
+        print(f"Page cache error: {e}")
+
+def cached_page(view):
+    """Serve an anonymous GET page from the page cache, keyed on scheme, host, path and query args.
+
+    Pages embed absolute URLs built from the request (og:url, share links,
+    _external asset URLs), so a page is only ever replayed to the same origin.
+    The key also carries the ETag computed by conditional_page, which must wrap
+    this decorator: it is read from the database on every request, so an edit
+    committed by any worker or instance turns into a cache miss everywhere
+    (pages without a validator are never cached).
+    Requests with pending flash messages bypass the cache both ways, since
+    their page shows one-off content.
+    """
+    @wraps(view)
+    def decorated_function(*args, **kwargs):
+        cache = get_page_cache()
+        if cache is None or request.method != 'GET' or '_flashes' in session or 'page_etag' not in g:
+            return view(*args, **kwargs)
+        key = request.host_url + request.path.lstrip('/') + '?' + urlencode(sorted(request.args.items(multi=True)))
+        key += '#' + g.page_etag
+        try:
+            page = cache.get(key)
+        except Exception as e:
+            print(f"Page cache error: {e}")
+            return view(*args, **kwargs)
+        if page is not None:
+            response = Response(page['body'], status=page['status'], headers=page['headers'])
+            response.headers['X-Cache'] = 'HIT'
+            return response
+        response = app.make_response(view(*args, **kwargs))
+        if response.status_code == 200 and not response.direct_passthrough and 'Set-Cookie' not in response.headers:
+            page = {
+                'status': response.status_code,
+                'headers': [[k, v] for k, v in response.headers.items() if k.lower() != 'content-length'],
+                'body': response.get_data(),
+            }
+            try:
+                cache.set(key, page, app.config['PAGE_CACHE_TTL'])
+            except Exception as e:
+                print(f"Page cache error: {e}")
+        response.headers['X-Cache'] = 'MISS'
+        return response
+    return decorated_function
+
+# ======================= CONDITIONAL RESPONSES =======================
+
+def conditional_page(validator):
+    """Answer If-None-Match/If-Modified-Since with 304 before the view renders anything.
+
+    ``validator`` takes the view's arguments and returns (etag_seed, last_modified)
+    from a cheap query, or None to serve the view unconditionally (e.g. a 404).
+    Caches that revalidate with If-Modified-Since alone trust last_modified, so
+    it must move on every change the page shows; return None for it when it
+    can't (e.g. deletions from a listing) and only the ETag is sent.
+    The site settings version is folded into the ETag, and 200/304 responses get
+    Cache-Control with s-maxage so the Vercel edge can cache them.
+    """
+    def decorator(view):
+        @wraps(view)
+        def decorated_function(*args, **kwargs):
+            if request.method != 'GET' or '_flashes' in session:
+                return view(*args, **kwargs)
+            validated = validator(*args, **kwargs)
+            if validated is None:
+                return view(*args, **kwargs)
+            seed, last_modified = validated
+            settings_version = site_settings_version(get_site_settings())
+            etag = hashlib.sha1(f"{seed}:{settings_version}".encode()).hexdigest()
+            # cached_page keys on this, so a page cached before the rows changed is never served under it
+            g.page_etag = etag
+
+            response = Response()
+            response.set_etag(etag)
+            # Assigning None would stamp the current time instead of leaving the header out
+            if last_modified is not None:
+                response.last_modified = last_modified
+            response.make_conditional(request)
+            if response.status_code != 304:
+                response = app.make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                response.set_etag(etag)
+                if last_modified is not None:
+                    response.last_modified = last_modified
+            response.cache_control.public = True
+            response.cache_control.max_age = 0
+            response.cache_control.s_maxage = app.config['EDGE_CACHE_SECONDS']
+            response.cache_control['stale-while-revalidate'] = app.config['EDGE_CACHE_SECONDS'] * 5
+            return response
+        return decorated_function
+    return decorator
+
+def active_internships_query(location_filter='all'):
+    query = Internship.query.filter_by(is_active=True)
+    if location_filter != 'all':
+        query = query.filter_by(location_type=location_filter)
+    return query
+
+def internships_validator():
+    """Validator for a listing page: count and newest update across the filtered set.
+
+    No Last-Modified: a deleted internship lowers the count but leaves no newer
+    timestamp behind, so only the ETag can tell the listing changed.
+    """
+    query = active_internships_query(request.args.get('location', 'all'))
+    count, last_modified = query.with_entities(func.count(Internship.id), func.max(Internship.updated_at)).one()
+    return f"list:{request.full_path}:{count}:{last_modified}", None
+
+def index_validator():
+    """Validator for the home page: its featured internships plus settings"""
+    count, last_modified = active_internships_query().with_entities(
+        func.count(Internship.id), func.max(Internship.updated_at)).one()
+    return f"index:{count}:{last_modified}", None
+
+def internship_detail_validator(slug):
+    row = db.session.query(Internship.id, Internship.updated_at).filter_by(slug=slug, is_active=True).first()
+    if row is None:
+        return None
+    # The page also shows site settings, so an edit to them must move Last-Modified too
+    settings_updated = get_site_settings().updated_at
+    last_modified = max(filter(None, (row.updated_at, settings_updated)), default=None)
+    return f"detail:{row.id}:{row.updated_at}", last_modified
+
 # ======================= PUBLIC ROUTES =======================
 
 @app.route('/health')
@@ -150,13 +2555,26 @@ def health_check():
     }
     
     try:
-        db.engine.connect()
+        with db.engine.connect() as connection:
+            connection.execute(db.text('SELECT 1'))
         status['database'] = 'connected'
     except Exception as e:
         status['database'] = f'error: {str(e)}'
+    status['pool'] = pool_status()
+    status['startup'] = {key: _startup[key] for key in ('done', 'failures', 'error', 'schema_version')}
+    status['startup']['timings_ms'] = startup_timings
     
     return jsonify(status), 200
 
+@app.route('/metrics')
+def metrics():
+    """Prometheus scrape endpoint; METRICS_TOKEN bearer or an admin session"""
+    token = app.config['METRICS_TOKEN']
+    authorized = 'admin_id' in session or (token and request.headers.get('Authorization') == f'Bearer {token}')
+    if not authorized:
+        return jsonify({'error': 'Unauthorized'}), 401
+    return Response(render_metrics(), mimetype='text/plain; version=0.0.4')
+
 @app.route('/debug-info')
 def debug_info():
     """Debug information endpoint - REMOVE IN PRODUCTION"""
@@ -174,6 +2592,8 @@ def debug_info():
     return 'Debug info disabled in production', 403
 
 @app.route('/')
+@conditional_page(index_validator)
+@cached_page
 def index():
     try:
         settings = get_site_settings()
@@ -184,21 +2604,21 @@ def index():
         return f"Application error: {str(e)}", 500
 
 @app.route('/internships')
+@conditional_page(internships_validator)
+@cached_page
 def internships():
     settings = get_site_settings()
-    page = request.args.get('page', 1, type=int)
     location_filter = request.args.get('location', 'all')
 
-    query = Internship.query.filter_by(is_active=True)
-
-    if location_filter != 'all':
-        query = query.filter_by(location_type=location_filter)
+    query = active_internships_query(location_filter)
 
-    internships_paginated = query.order_by(Internship.created_at.desc()).paginate(page=page, per_page=9, error_out=False)
+    internships_paginated = paginate_listing(query, Internship.created_at, per_page=9)
 
     return render_template('internships.html', settings=settings, internships=internships_paginated, location_filter=location_filter)
 
 @app.route('/internships/<slug>')
+@conditional_page(internship_detail_validator)
+@cached_page
 def internship_detail(slug):
     settings = get_site_settings()
     internship = Internship.query.filter_by(slug=slug, is_active=True).first_or_404()
@@ -229,9 +2649,7 @@ def apply(slug):
                 return redirect(url_for('apply', slug=slug))
 
             if file and allowed_file(file.filename):
-                filename = secure_filename(f"{datetime.now().strftime('%Y%m%d%H%M%S')}_{file.filename}")
-                file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                file.save(file_path)
+                filename = store_resume(file)
 
                 applicant = Applicant(
                     internship_id=internship.id,
@@ -245,20 +2663,12 @@ def apply(slug):
                 )
 
                 db.session.add(applicant)
+                db.session.flush()
+                queue_email(email, f'Application Received - {internship.title}',
+                            'emails/application_confirmation.html',
+                            applicant=applicant, internship=internship)
                 db.session.commit()
-
-                try:
-                    msg = Message(
-                        f'Application Received - {internship.title}',
-                        recipients=[email]
-                    )
-                    msg.html = render_template('emails/application_confirmation.html',
-                                              applicant=applicant,
-                                              internship=internship,
-                                              settings=settings)
-                    mail.send(msg)
-                except Exception as e:
-                    print(f"Email error: {e}")
+                kick_outbox()
 
                 flash('Application submitted successfully! We will contact you soon.', 'success')
                 return redirect(url_for('internships'))
@@ -384,28 +2794,6 @@ def admin_search():
         }
     ]
 
-    internships = Internship.query.all()
-    for internship in internships:
-        search_items.append({
-            'title': internship.title,
-            'url': url_for('edit_internship', id=internship.id),
-            'icon': 'briefcase',
-            'category': 'Internship',
-            'keywords': [internship.location.lower(), internship.skills.lower(), internship.location_type.lower(), internship.title.lower()],
-            'subtitle': f"{internship.location} • {internship.location_type}"
-        })
-
-    applicants = Applicant.query.all()
-    for applicant in applicants:
-        search_items.append({
-            'title': applicant.full_name,
-            'url': url_for('view_applicant', id=applicant.id),
-            'icon': 'user',
-            'category': 'Applicant',
-            'keywords': [applicant.email.lower(), applicant.phone, applicant.internship.title.lower(), applicant.full_name.lower()],
-            'subtitle': f"{applicant.email} • Applied for {applicant.internship.title}"
-        })
-
     def matches_query(text, query):
         text = text.lower()
         query = query.lower()
@@ -429,9 +2817,6 @@ def admin_search():
         if not matched:
             if matches_query(item['category'], query):
                 matched = True
-        if not matched and item.get('subtitle'):
-            if matches_query(item['subtitle'], query):
-                matched = True
         if matched:
             results.append({
                 'title': item['title'],
@@ -441,7 +2826,25 @@ def admin_search():
                 'subtitle': item.get('subtitle', '')
             })
 
-    return jsonify(results[:15])
+    for model, doc in get_search_backend().search(query, limit=SEARCH_LIMIT - len(results)):
+        if model == 'Internship':
+            results.append({
+                'title': doc['title'],
+                'url': url_for('edit_internship', id=doc['id']),
+                'icon': 'briefcase',
+                'category': 'Internship',
+                'subtitle': f"{doc['location']} • {doc['location_type']}"
+            })
+        else:
+            results.append({
+                'title': doc['full_name'],
+                'url': url_for('view_applicant', id=doc['id']),
+                'icon': 'user',
+                'category': 'Applicant',
+                'subtitle': f"{doc['email']} • Applied for {doc['internship_title']}"
+            })
+
+    return jsonify(results[:SEARCH_LIMIT])
 
 # ======================= ADMIN ROUTES =======================
 
@@ -476,26 +2879,18 @@ def admin_logout():
 @login_required
 def admin_dashboard():
     settings = get_site_settings()
-    total_internships = Internship.query.count()
-    active_internships = Internship.query.filter_by(is_active=True).count()
-    total_applicants = Applicant.query.count()
-    pending_applicants = Applicant.query.filter_by(status='pending').count()
-    total_messages = ContactMessage.query.count()
-    unread_messages = ContactMessage.query.filter_by(is_read=False).count()
-
-    recent_applicants = Applicant.query.order_by(Applicant.applied_at.desc()).limit(5).all()
+    stats = get_dashboard_stats()
+
+    recent_applicants = with_internship(Applicant.query).order_by(Applicant.applied_at.desc()).limit(5).all()
     recent_internships = Internship.query.order_by(Internship.created_at.desc()).limit(5).all()
+    counts = applicant_counts([internship.id for internship in recent_internships])
 
     return render_template('admin/dashboard.html',
                          settings=settings,
-                         total_internships=total_internships,
-                         active_internships=active_internships,
-                         total_applicants=total_applicants,
-                         pending_applicants=pending_applicants,
-                         total_messages=total_messages,
-                         unread_messages=unread_messages,
                          recent_applicants=recent_applicants,
-                         recent_internships=recent_internships)
+                         recent_internships=recent_internships,
+                         applicant_counts=counts,
+                         **stats)
 
 @app.route('/admin/post_intern', methods=['GET', 'POST'])
 @login_required
@@ -538,6 +2933,7 @@ def post_intern():
 
             db.session.add(internship)
             db.session.commit()
+            invalidate_page_cache()
 
             flash('Internship posted successfully!', 'success')
             return redirect(url_for('admin_internships'))
@@ -553,9 +2949,9 @@ def post_intern():
 @login_required
 def admin_internships():
     settings = get_site_settings()
-    page = request.args.get('page', 1, type=int)
-    internships = Internship.query.order_by(Internship.created_at.desc()).paginate(page=page, per_page=10, error_out=False)
-    return render_template('admin/internships.html', settings=settings, internships=internships)
+    internships = paginate_listing(Internship.query, Internship.created_at, per_page=10)
+    counts = applicant_counts([internship.id for internship in internships.items])
+    return render_template('admin/internships.html', settings=settings, internships=internships, applicant_counts=counts)
 
 @app.route('/admin/internships/<int:id>/edit', methods=['GET', 'POST'])
 @login_required
@@ -577,6 +2973,7 @@ def edit_internship(id):
             internship.updated_at = datetime.utcnow()
 
             db.session.commit()
+            invalidate_page_cache()
             flash('Internship updated successfully!', 'success')
             return redirect(url_for('admin_internships'))
 
@@ -593,6 +2990,7 @@ def delete_internship(id):
         internship = Internship.query.get_or_404(id)
         db.session.delete(internship)
         db.session.commit()
+        invalidate_page_cache()
         flash('Internship deleted successfully!', 'success')
     except Exception as e:
         db.session.rollback()
@@ -604,7 +3002,6 @@ def delete_internship(id):
 @login_required
 def admin_applicants():
     settings = get_site_settings()
-    page = request.args.get('page', 1, type=int)
     internship_id = request.args.get('internship', type=int)
     status_filter = request.args.get('status', 'all')
 
@@ -616,8 +3013,8 @@ def admin_applicants():
     if status_filter != 'all':
         query = query.filter_by(status=status_filter)
 
-    applicants = query.order_by(Applicant.applied_at.desc()).paginate(page=page, per_page=20, error_out=False)
-    internships = Internship.query.all()
+    applicants = paginate_listing(query, Applicant.applied_at, per_page=20, load=with_internship)
+    internships = internship_choices()
 
     return render_template('admin/applicants.html',
                          settings=settings,
@@ -626,6 +3023,34 @@ def admin_applicants():
                          selected_internship=internship_id,
                          status_filter=status_filter)
 
+@app.route('/admin/applicants/export')
+@login_required
+def export_applicants():
+    """Stream every applicant matching the admin_applicants filters as CSV, XLSX or NDJSON"""
+    export_format = request.args.get('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({'error': f"Unknown export format: {export_format}"}), 400
+    internship_id = request.args.get('internship', type=int)
+    status_filter = request.args.get('status', 'all')
+    conditions = applicant_filters(internship_id=internship_id, status=status_filter)
+
+    name = 'applicants'
+    if internship_id:
+        slug = db.session.query(Internship.slug).filter_by(id=internship_id).scalar()
+        name += f"-{slug or internship_id}"
+    if status_filter != 'all':
+        name += f"-{status_filter}"
+    mimetype, extension = EXPORT_FORMATS[export_format]
+    body = EXPORT_WRITERS[export_format](export_rows(conditions))
+    response = Response(stream_with_context(body), mimetype=mimetype)
+    # Slug and status come from the database and query string; keep only filename-safe characters
+    filename = secure_filename(f"{name}-{datetime.utcnow():%Y%m%d}.{extension}")
+    response.headers.set('Content-Disposition', 'attachment', filename=filename)
+    response.headers['Cache-Control'] = 'no-store'
+    # Tell nginx-style proxies to pass chunks through instead of buffering the whole export
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
 @app.route('/admin/applicants/<int:id>')
 @login_required
 def view_applicant(id):
@@ -647,6 +3072,82 @@ def update_applicant_status(id):
 
     return redirect(url_for('view_applicant', id=id))
 
+def bulk_status_payload_error(payload):
+    """Describe what is wrong with a bulk-status JSON body, or return None if its shape is valid"""
+    if not isinstance(payload, dict):
+        return 'Expected a JSON object'
+    ids = payload.get('ids')
+    if ids is not None:
+        if not isinstance(ids, list):
+            return '"ids" must be a list of applicant ids'
+        if not all((isinstance(i, int) and not isinstance(i, bool)) or (isinstance(i, str) and i.isdigit()) for i in ids):
+            return '"ids" must contain only integer applicant ids'
+    for key in ('status', 'current_status', 'applied_from', 'applied_to', 'subject', 'message'):
+        if payload.get(key) is not None and not isinstance(payload[key], str):
+            return f'"{key}" must be a string'
+    internship = payload.get('internship')
+    if internship is not None and (isinstance(internship, bool) or not isinstance(internship, (int, str))):
+        return '"internship" must be an internship id'
+    return None
+
+@app.route('/admin/applicants/bulk-status', methods=['POST'])
+@login_required
+def bulk_update_applicant_status():
+    """Change the status of many applicants at once.
+
+    Takes a form post from the applicants page or a JSON body with ``status``
+    plus either ``ids`` or filters (``internship``, ``current_status``,
+    ``applied_from``/``applied_to`` as YYYY-MM-DD), and optionally ``notify``
+    with a ``subject``/``message`` override. JSON callers get the counts back.
+    """
+    payload = request.get_json(silent=True)
+    wants_json = payload is not None
+    if payload is None:
+        payload = request.form.to_dict()
+        payload['ids'] = request.form.getlist('ids') if payload.get('scope', 'selected') == 'selected' else None
+    else:
+        error = bulk_status_payload_error(payload)
+        if error:
+            return jsonify({'error': error}), 400
+
+    try:
+        def parse_date(key):
+            value = payload.get(key)
+            return datetime.strptime(value, '%Y-%m-%d') if value else None
+
+        conditions = applicant_filters(
+            internship_id=int(payload['internship']) if payload.get('internship') else None,
+            status=payload.get('current_status'),
+            applied_from=parse_date('applied_from'),
+            applied_to=parse_date('applied_to'),
+        )
+        ids = payload.get('ids')
+        if ids is not None and not wants_json and not ids:
+            raise ValueError('Select at least one applicant.')
+        notify = payload.get('notify') in (True, 'true', 'on', '1', 1)
+        result = bulk_update_status(payload.get('status'), ids=ids, conditions=conditions, notify=notify,
+                                    subject=(payload.get('subject') or '').strip() or None,
+                                    message=(payload.get('message') or '').strip() or None)
+    except ValueError as e:
+        db.session.rollback()
+        if wants_json:
+            return jsonify({'error': str(e)}), 400
+        flash(str(e), 'danger')
+    except Exception as e:
+        db.session.rollback()
+        if wants_json:
+            return jsonify({'error': str(e)}), 500
+        flash(f'An error occurred: {str(e)}', 'danger')
+    else:
+        if wants_json:
+            return jsonify(result)
+        notified = f", {result['notified']} notified" if notify else ''
+        flash(f"{result['updated']} applicant(s) moved to {result['status']} "
+              f"({result['unchanged']} already were{notified}).", 'success')
+
+    return redirect(url_for('admin_applicants', internship=payload.get('internship') or None,
+                            status=payload.get('current_status') or 'all'))
+
 @app.route('/admin/mail', methods=['GET', 'POST'])
 @login_required
 def admin_mail():
@@ -662,32 +3163,37 @@ def admin_mail():
                 flash('Please fill all required fields and select recipients.', 'danger')
                 return redirect(url_for('admin_mail'))
 
-            recipients = Applicant.query.filter(Applicant.id.in_(recipient_ids)).all()
-
-            for recipient in recipients:
-                msg = Message(subject, recipients=[recipient.email])
-                msg.html = render_template('emails/custom_email.html',
-                                          recipient=recipient,
-                                          message_body=message_body,
-                                          settings=settings)
-                mail.send(msg)
+            recipients = db.session.query(Applicant.id, Applicant.email) \
+                .filter(Applicant.id.in_(recipient_ids)).all()
+            campaign = queue_campaign(subject, message_body, recipients)
+            db.session.commit()
+            kick_outbox(workers=app.config['OUTBOX_WORKERS'], campaign_id=campaign.id)
 
-            flash(f'Email sent successfully to {len(recipients)} recipient(s)!', 'success')
+            flash(f'Email campaign #{campaign.id} queued for {len(recipients)} recipient(s)!', 'success')
             return redirect(url_for('admin_mail'))
 
         except Exception as e:
+            db.session.rollback()
             flash(f'An error occurred: {str(e)}', 'danger')
             return redirect(url_for('admin_mail'))
 
-    applicants = Applicant.query.order_by(Applicant.applied_at.desc()).all()
+    applicants = with_internship(Applicant.query).order_by(Applicant.applied_at.desc()).all()
     return render_template('admin/mail.html', settings=settings, applicants=applicants)
 
+@app.route('/admin/mail/campaigns/<int:id>')
+@login_required
+def campaign_detail(id):
+    campaign = EmailCampaign.query.get_or_404(id)
+    status = campaign_status(campaign)
+    failures = campaign.emails.filter_by(status='failed').order_by(EmailOutbox.id).limit(100).all()
+    status['failures'] = [{'recipient': entry.recipient, 'error': entry.last_error} for entry in failures]
+    return jsonify(status)
+
 @app.route('/admin/messages')
 @login_required
 def admin_messages():
     settings = get_site_settings()
-    page = request.args.get('page', 1, type=int)
-    messages = ContactMessage.query.order_by(ContactMessage.created_at.desc()).paginate(page=page, per_page=20, error_out=False)
+    messages = paginate_listing(ContactMessage.query, ContactMessage.created_at, per_page=20)
     return render_template('admin/messages.html', settings=settings, messages=messages)
 
 @app.route('/admin/messages/<int:id>')
@@ -720,6 +3226,7 @@ def admin_settings():
 
     if request.method == 'POST':
         try:
+            settings = load_site_settings()
             settings.company_name = request.form.get('company_name', '').strip()
             settings.tagline = request.form.get('tagline', '').strip()
             settings.about_text = request.form.get('about_text', '').strip()
@@ -730,6 +3237,7 @@ def admin_settings():
             settings.social_facebook = request.form.get('social_facebook', '').strip()
 
             db.session.commit()
+            invalidate_page_cache()
             flash('Settings updated successfully!', 'success')
             return redirect(url_for('admin_settings'))
 
@@ -741,7 +3249,17 @@ def admin_settings():
 
 @app.route('/uploads/<filename>')
 def uploaded_file(filename):
-    return send_from_directory(app.config['UPLOAD_FOLDER'], filename)
+    return get_resume_storage().response(filename)
+
+@app.route('/tasks/outbox/drain', methods=['GET', 'POST'])
+def drain_outbox_task():
+    """Drain the email outbox; called by a scheduler with the CRON_SECRET bearer token or by an admin"""
+    secret = app.config['CRON_SECRET']
+    authorized = 'admin_id' in session or (secret and request.headers.get('Authorization') == f'Bearer {secret}')
+    if not authorized:
+        return jsonify({'error': 'Unauthorized'}), 401
+    sent, failed = drain_outbox(time_limit=app.config['OUTBOX_DRAIN_SECONDS'])
+    return jsonify({'sent': sent, 'failed': failed}), 200
 
 @app.route('/favicon.ico')
 def favicon():
@@ -787,51 +3305,254 @@ def handle_exception(e):
     except:
         return jsonify({'error': 'Internal server error', 'message': str(e)}), 500
 
-# ======================= INITIALIZATION =======================
-
-def init_db():
-    """Initialize database with default data"""
+# ======================= SCHEMA MIGRATIONS =======================
+
+MIGRATIONS = []
+
+def migration(version, name):
+    """Register upgrade(connection) as schema migration ``version``.
+
+    Migration 1 runs create_all, so a fresh database already matches the
+    models and later migrations must be no-ops there; they only bring older
+    databases up to date (check for the column/index before adding it).
+    """
+    def decorator(upgrade):
+        MIGRATIONS.append((version, name, upgrade))
+        MIGRATIONS.sort(key=lambda m: m[0])
+        return upgrade
+    return decorator
+
+@migration(1, 'baseline tables')
+def create_baseline_tables(connection):
+    db.metadata.create_all(bind=connection)
+
+@migration(2, 'email outbox claim_token and campaign_id')
+def add_outbox_campaign_columns(connection):
+    columns = {column['name'] for column in inspect(connection).get_columns('email_outbox')}
+    if 'claim_token' not in columns:
+        connection.execute(db.text('ALTER TABLE email_outbox ADD COLUMN claim_token VARCHAR(32)'))
+    if 'campaign_id' not in columns:
+        connection.execute(db.text('ALTER TABLE email_outbox ADD COLUMN campaign_id INTEGER REFERENCES email_campaign (id)'))
+
+@migration(3, 'composite indexes for listing and outbox queries')
+def add_hot_query_indexes(connection):
+    for model in (Internship, Applicant, ContactMessage, EmailOutbox):
+        for index in model.__table__.indexes:
+            index.create(connection, checkfirst=True)
+
+@migration(4, 'default admin and site settings')
+def seed_defaults(connection):
+    if connection.execute(db.select(Admin.id).limit(1)).first() is None:
+        connection.execute(db.insert(Admin).values(
+            username='Shramicadmin',
+            password=generate_password_hash('Shramic@2025'),
+            email='admin@shramic.com'
+        ))
+    if connection.execute(db.select(SiteSettings.id).limit(1)).first() is None:
+        connection.execute(db.insert(SiteSettings).values(
+            company_name='Shramic',
+            tagline='Empowering Careers Through Excellence',
+            about_text='Shramic is committed to bridging the gap between talented individuals and leading organizations. We provide comprehensive internship opportunities that shape futures and build careers.',
+            contact_email='shramicnetworks@gmail.com',
+            contact_phone='+91 98765 43210'
+        ))
+
+@migration(5, 'site settings updated_at')
+def add_settings_updated_at(connection):
+    columns = {column['name'] for column in inspect(connection).get_columns('site_settings')}
+    if 'updated_at' not in columns:
+        connection.execute(db.text('ALTER TABLE site_settings ADD COLUMN updated_at TIMESTAMP'))
+        connection.execute(db.update(SiteSettings).values(updated_at=datetime.utcnow()))
+
+@migration(6, 'full-text search index')
+def add_search_index(connection):
+    # Built whatever SEARCH_BACKEND says, so switching to 'database' later needs no DDL at startup
+    backend = DATABASE_SEARCH_BACKENDS.get(connection.dialect.name)
+    if backend is None:
+        return
     try:
-        db.create_all()
+        with connection.begin_nested():
+            backend.setup(connection)
+    except Exception as e:
+        # e.g. SQLite built without FTS5; check_search_schema() then keeps search in memory
+        print(f"Full-text search setup failed, SEARCH_BACKEND=database will use the in-memory index: {e}")
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+def migrate():
+    """Apply pending migrations in order, each in its own transaction; returns the versions applied"""
+    SchemaVersion.__table__.create(db.engine, checkfirst=True)
+    with db.engine.connect() as connection:
+        applied = set(connection.execute(db.select(SchemaVersion.version)).scalars())
+    done = []
+    for version, name, upgrade in MIGRATIONS:
+        if version in applied:
+            continue
+        try:
+            with db.engine.begin() as connection:
+                upgrade(connection)
+                connection.execute(db.insert(SchemaVersion).values(version=version, name=name, applied_at=datetime.utcnow()))
+        except IntegrityError:
+            # Another instance recorded this version first and its transaction won
+            print(f"Migration {version:04d} already applied elsewhere")
+            continue
+        print(f"Applied migration {version:04d}: {name}")
+        done.append(version)
+    return done
+
+def hot_queries():
+    """(label, statement, ordered) for the query shapes the indexes above are meant to serve.
+
+    ``ordered`` marks queries whose ORDER BY should be read straight off an
+    index rather than sorted.
+    """
+    now = datetime.utcnow()
+    internships = db.select(Internship.id).order_by(Internship.created_at.desc(), Internship.id.desc()).limit(10)
+    applicants = db.select(Applicant.id).order_by(Applicant.applied_at.desc(), Applicant.id.desc()).limit(20)
+    messages = db.select(ContactMessage.id).order_by(ContactMessage.created_at.desc(), ContactMessage.id.desc()).limit(20)
+    return [
+        ('public internships', internships.where(Internship.is_active.is_(True)), True),
+        ('public internships by location', internships.where(Internship.is_active.is_(True), Internship.location_type == 'remote'), True),
+        ('public internships after cursor', internships.where(Internship.is_active.is_(True),
+                                                              tuple_(Internship.created_at, Internship.id) < tuple_(now, 0)), True),
+        ('admin internships', internships, True),
+        ('applicants', applicants, True),
+        ('applicants after cursor', applicants.where(tuple_(Applicant.applied_at, Applicant.id) < tuple_(now, 0)), True),
+        ('applicants for internship', applicants.where(Applicant.internship_id == 1), True),
+        ('applicants by status', applicants.where(Applicant.status == 'pending'), True),
+        ('applicant counts', db.select(Applicant.internship_id, func.count(Applicant.id))
+            .where(Applicant.internship_id.in_([1, 2])).group_by(Applicant.internship_id), False),
+        ('messages', messages, True),
+        ('unread messages', db.select(func.count(ContactMessage.id)).where(ContactMessage.is_read.is_(False)), False),
+        ('due outbox entries', db.select(EmailOutbox.id).where(EmailOutbox.status.in_(['pending', 'sending']),
+                                                               EmailOutbox.next_attempt_at <= now)
+            .order_by(EmailOutbox.id).limit(50), False),
+        ('claimed outbox entries', db.select(EmailOutbox.id).where(EmailOutbox.claim_token == 'token'), False),
+        ('campaign status', db.select(EmailOutbox.status, func.count(EmailOutbox.id))
+            .where(EmailOutbox.campaign_id == 1).group_by(EmailOutbox.status), False),
+    ]
 
-        if not Admin.query.first():
-            admin = Admin(
-                username='Shramicadmin',
-                password=generate_password_hash('Shramic@2025'),
-                email='admin@shramic.com'
-            )
-            db.session.add(admin)
+def explain_problems(statement, ordered):
+    """EXPLAIN a statement and describe any full table scan, or sort when ``ordered`` is set"""
+    dialect = db.engine.dialect
+    sql = str(statement.compile(dialect=dialect, compile_kwargs={'literal_binds': True}))
+    problems = []
+    with db.engine.connect() as connection:
+        if dialect.name == 'sqlite':
+            for row in connection.execute(db.text('EXPLAIN QUERY PLAN ' + sql)):
+                detail = row[-1]
+                if detail.startswith('SCAN ') and ' USING ' not in detail:
+                    problems.append(f"full scan ({detail})")
+                if ordered and 'TEMP B-TREE FOR ORDER BY' in detail:
+                    problems.append('ORDER BY not served by an index')
+        elif dialect.name == 'postgresql':
+            # Tiny tables make a seq scan the cheapest plan; forbid it so the check sees index usability
+            connection.execute(db.text('SET LOCAL enable_seqscan = off'))
+            for (line,) in connection.execute(db.text('EXPLAIN ' + sql)):
+                if 'Seq Scan on' in line:
+                    problems.append(f"full scan ({line.strip()})")
+                if ordered and re.match(r'\s*(->\s*)?(Incremental )?Sort\b', line):
+                    problems.append('ORDER BY not served by an index')
+        else:
+            raise RuntimeError(f"check-indexes does not support {dialect.name}")
+    return problems
+
+@app.cli.command('migrate')
+def migrate_command():
+    """Apply pending schema migrations."""
+    done = migrate()
+    print(f"Schema at version {SCHEMA_VERSION} ({len(done)} migration(s) applied)")
+
+@app.cli.command('check-indexes')
+def check_indexes_command():
+    """EXPLAIN the hot queries and exit non-zero if any needs a full scan or sort."""
+    failures = 0
+    for label, statement, ordered in hot_queries():
+        problems = explain_problems(statement, ordered)
+        print(f"{'FAIL' if problems else 'ok'}  {label}" + (f": {'; '.join(problems)}" if problems else ''))
+        failures += bool(problems)
+    if failures:
+        raise SystemExit(f"{failures} hot query(ies) without a matching index")
 
-        if not SiteSettings.query.first():
-            settings = SiteSettings(
-                company_name='Shramic',
-                tagline='Empowering Careers Through Excellence',
-                about_text='Shramic is committed to bridging the gap between talented individuals and leading organizations. We provide comprehensive internship opportunities that shape futures and build careers.',
-                contact_email='shramicnetworks@gmail.com',
-                contact_phone='+91 98765 43210'
-            )
-            db.session.add(settings)
+# ======================= INITIALIZATION =======================
 
-        db.session.commit()
-        print("Database initialized successfully!")
-    except Exception as e:
-        print(f"Database initialization error: {e}")
-        db.session.rollback()
+_startup = {'done': False, 'failures': 0, 'retry_at': 0.0, 'error': None, 'schema_version': None}
+_startup_lock = threading.Lock()
 
-# Initialize database lazily on first request
-@app.before_request
-def initialize_database():
-    if not hasattr(app, 'db_initialized'):
+def database_schema_version():
+    """Highest applied migration, or 0 for a database that has never been migrated"""
+    with db.engine.connect() as connection:
+        if not inspect(connection).has_table(SchemaVersion.__tablename__):
+            return 0
+        return connection.execute(db.select(func.max(SchemaVersion.version))).scalar() or 0
+
+def init_db():
+    """Apply pending migrations (schema, full-text search index and default data)"""
+    return migrate()
+
+def bootstrap():
+    """Startup work for one process: a schema-version check, migrating only when behind"""
+    version = database_schema_version()
+    if version < SCHEMA_VERSION:
+        if not app.config['AUTO_MIGRATE']:
+            raise RuntimeError(f"Database schema is at version {version} but this code needs {SCHEMA_VERSION}; "
+                               f"run 'flask init-db'")
+        migrate()
+        version = SCHEMA_VERSION
+    elif version > SCHEMA_VERSION:
+        print(f"⚠️  Database schema version {version} is newer than this code ({SCHEMA_VERSION})")
+    check_search_schema()
+    _startup['schema_version'] = version
+
+def warm_up():
+    """Run bootstrap() once per process and report whether it has succeeded.
+
+    Concurrent callers wait on a lock rather than bootstrapping twice. After
+    a failure, further attempts are held off with exponential backoff (up to
+    STARTUP_RETRY_MAX seconds) so a broken database does not cost every
+    request a connection attempt.
+    """
+    if _startup['done']:
+        return True
+    if time.monotonic() < _startup['retry_at']:
+        return False
+    with _startup_lock:
+        if _startup['done']:
+            return True
+        if time.monotonic() < _startup['retry_at']:
+            return False
+        started = time.perf_counter()
         try:
             with app.app_context():
-                # Test database connection
-                db.engine.connect()
-                init_db()
-                app.db_initialized = True
-                print("Database initialized successfully on first request")
+                bootstrap()
         except Exception as e:
-            print(f"Database initialization error: {e}")
-            import traceback
-            traceback.print_exc()
-            # Don't block the request, but log the error
-            app.db_initialized = False
\ No newline at end of file
+            _startup['failures'] += 1
+            _startup['error'] = str(e)
+            delay = min(app.config['STARTUP_RETRY_MAX'], 2 ** (_startup['failures'] - 1))
+            _startup['retry_at'] = time.monotonic() + delay
+            print(f"Startup failed (attempt {_startup['failures']}, retrying in {delay}s): {e}")
+            return False
+        _startup.update(done=True, error=None)
+        startup_timings['bootstrap'] = round((time.perf_counter() - started) * 1000, 1)
+        print(f"Startup complete (schema version {_startup['schema_version']}): "
+              + ', '.join(f"{phase} {ms:.0f}ms" for phase, ms in startup_timings.items()))
+        return True
+
+@app.before_request
+def ensure_started():
+    if not _startup['done']:
+        warm_up()
+
+@app.cli.command('init-db')
+def init_db_command():
+    """Create or upgrade the schema and seed default data."""
+    done = init_db()
+    print(f"Database initialized at schema version {SCHEMA_VERSION} ({len(done)} migration(s) applied)")
+
+# Module body after the imports: config, engine, models, routes
+startup_timings['app'] = round((time.perf_counter() - _process_started) * 1000 - startup_timings['imports'], 1)
+
+if app.config['STARTUP_WARMUP']:
+    # Serverless: do the startup work while the function instance is created,
+    # not inside the first visitor's request
+    warm_up()
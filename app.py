@@ -1,6 +1,7 @@
 from flask import Flask, render_template, request, redirect, url_for, flash, session, send_from_directory, jsonify
 from flask_sqlalchemy import SQLAlchemy
 from flask_mail import Mail, Message
+from jinja2 import FileSystemBytecodeCache
 from werkzeug.security import generate_password_hash, check_password_hash
 from werkzeug.utils import secure_filename
 from datetime import datetime
@@ -13,8 +14,11 @@ app = Flask(__name__)
 app.config['SECRET_KEY'] = secrets.token_hex(16)
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///shramic.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Long-running server: check pooled connections before use and recycle them before idle timeouts
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'pool_pre_ping': True, 'pool_recycle': 1800}
 app.config['UPLOAD_FOLDER'] = 'static/uploads'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+app.config['TEMPLATES_AUTO_RELOAD'] = os.environ.get('FLASK_ENV') != 'production'
 
 # Flask-Mail Configuration (Update with your credentials)
 app.config['MAIL_SERVER'] = 'smtp.gmail.com'
@@ -27,6 +31,10 @@ app.config['MAIL_DEFAULT_SENDER'] = 'Shramic <shramicnetworks@gmail.com>'
 db = SQLAlchemy(app)
 mail = Mail(app)
 
+# Compiled templates shared by every worker, kept in Jinja's per-user 0700 temp directory
+# (fill it with: python build_templates.py --bytecode-cache --app app)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+
 # Ensure upload folder exists
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
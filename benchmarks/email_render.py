@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-recipient email rendering: a full Jinja render for every
+recipient (the old admin_mail loop) versus PrerenderedEmail, which renders
+the campaign once and only splices in each recipient's fields.
+Run: python benchmarks/email_render.py [--recipients 2000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from flask import render_template
+
+from api.index import app, Applicant, Internship, SiteSettings, PrerenderedEmail
+
+def make_recipients(count):
+    return [Applicant(id=i, full_name=f'Applicant {i} <O\'Neil & Co>', email=f'applicant{i}@example.com')
+            for i in range(count)]
+
+def time_per_recipient(render, recipients):
+    start = time.perf_counter()
+    outputs = [render(recipient) for recipient in recipients]
+    return (time.perf_counter() - start) / len(recipients), outputs
+
+def bench(name, template, shared, key, recipients):
+    def full(recipient):
+        return render_template(template, **shared, **{key: recipient})
+
+    def prerendered(recipient):
+        return campaign.render(**{key: recipient})
+
+    setup_start = time.perf_counter()
+    campaign = PrerenderedEmail(template, shared, [key])
+    setup = time.perf_counter() - setup_start
+
+    before, expected = time_per_recipient(full, recipients)
+    after, actual = time_per_recipient(prerendered, recipients)
+    assert actual == expected, 'pre-rendered output differs from a full render'
+    assert campaign.parts is not None, 'template fell back to full rendering'
+
+    print(f'{name} ({len(recipients)} recipients)')
+    print(f'  full render per recipient:   {before * 1e6:9.1f} us')
+    print(f'  pre-rendered per recipient:  {after * 1e6:9.1f} us  (+{setup * 1e3:.2f} ms once per campaign)')
+    print(f'  speedup:                     {before / after:9.1f}x')
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--recipients', type=int, default=2000)
+    args = parser.parse_args()
+
+    settings = SiteSettings(company_name='Shramic', tagline='Empowering Careers Through Excellence')
+    internship = Internship(id=1, title='Data Science Intern', location='Pune', location_type='remote',
+                            duration='3 months', stipend='10,000/month')
+    recipients = make_recipients(args.recipients)
+
+    with app.test_request_context('/', base_url='https://example.com/'):
+        bench('emails/custom_email.html', 'emails/custom_email.html',
+              {'settings': settings, 'message_body': '<p>' + 'Campaign body. ' * 200 + '</p>'},
+              'recipient', recipients)
+        bench('emails/application_confirmation.html', 'emails/application_confirmation.html',
+              {'settings': settings, 'internship': internship}, 'applicant', recipients)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""
+Benchmark the public and admin routes against a seeded database.
+Run: python benchmarks/routes.py [--internships 5000 --applicants 500000 --messages 50000]
+
+Seeds a local SQLite (default) or PostgreSQL (--database-url) database with
+the requested volumes, starts an SMTP sink on localhost in place of Gmail,
+then drives every scenario twice:
+
+  client  sequentially through the Flask test client (app + DB cost only)
+  http    with --concurrency workers against a threaded local HTTP server
+
+and prints throughput and p50/p95/p99 latency per route. The seeded
+database is reused while its volumes match, so only the first run pays for
+seeding; a database holding anything else is only wiped with --reset.
+--save-baseline FILE stores the results; --baseline FILE compares
+against them and exits non-zero when a route's p95 or throughput regressed
+by more than --tolerance.
+"""
+
+import argparse
+import http.client
+import io
+import json
+import logging
+import os
+import queue
+import random
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+ADMIN_LOGIN = {'username': 'Shramicadmin', 'password': 'Shramic@2025'}
+ROLES = ['Data Science', 'Web Development', 'Marketing', 'Design', 'Finance', 'Operations', 'Content', 'Sales']
+CITIES = ['Pune', 'Mumbai', 'Delhi', 'Bengaluru', 'Hyderabad', 'Chennai', 'Kolkata', 'Remote']
+STATUSES = ['pending'] * 6 + ['reviewed'] * 2 + ['shortlisted', 'rejected']
+SEARCH_TERMS = ['data', 'pune', 'applicant 42', 'design intern', '98', 'marketing']
+
+# ======================= SMTP SINK =======================
+
+class SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib: accept every message and count it"""
+
+    def reply(self, line):
+        self.wfile.write(line.encode() + b'\r\n')
+
+    def handle(self):
+        self.reply('220 localhost benchmark SMTP sink')
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line[:4].upper()
+            if command == b'EHLO':
+                self.wfile.write(b'250-localhost\r\n250 SIZE 52428800\r\n')
+            elif command == b'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                while self.rfile.readline() not in (b'.\r\n', b''):
+                    pass
+                with self.server.lock:
+                    self.server.messages += 1
+                self.reply('250 OK')
+            elif command == b'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                self.reply('250 OK')
+
+class SMTPSink(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), SMTPSinkHandler)
+        self.lock = threading.Lock()
+        self.messages = 0
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+# ======================= SEEDING =======================
+
+def seed(m, internships, applicants, messages, reset=False, batch_size=10000):
+    """Fill the database with the requested volumes unless it already holds exactly that.
+
+    Reseeding deletes every internship, applicant, message and outbox row, so a
+    database holding data this script did not seed is refused unless ``reset``.
+    """
+    db = m.db
+    counts = (m.Internship.query.count(), m.Applicant.query.count(), m.ContactMessage.query.count())
+    if counts == (internships, applicants, messages):
+        print(f"Reusing seeded database ({internships} internships, {applicants} applicants, {messages} messages)")
+        return
+    seeded_here = m.Internship.query.filter_by(slug='bench-intern-1').first() is not None
+    if any(counts) and not seeded_here and not reset:
+        raise SystemExit(f"Refusing to wipe {db.engine.url.render_as_string(hide_password=True)}: it holds "
+                         f"{counts[0]} internships, {counts[1]} applicants and {counts[2]} messages not seeded "
+                         f"by this benchmark. Point --database-url at a scratch database or pass --reset.")
+    print(f"Seeding {internships} internships, {applicants} applicants, {messages} messages...")
+    started = time.perf_counter()
+    for model in (m.EmailOutbox, m.EmailCampaign, m.Applicant, m.ContactMessage, m.Internship):
+        db.session.execute(db.delete(model))
+    db.session.commit()
+
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    resume = store_bench_resume(m)
+
+    def insert(model, rows):
+        for start in range(0, len(rows), batch_size):
+            db.session.execute(db.insert(model), rows[start:start + batch_size])
+            db.session.commit()
+
+    insert(m.Internship, [{
+        'id': i,
+        'title': f"{ROLES[i % len(ROLES)]} Intern {i}",
+        'slug': f"bench-intern-{i}",
+        'description': f"Work with the {ROLES[i % len(ROLES)]} team on real projects. " * 20,
+        'skills': 'python, sql, communication, excel',
+        'location': CITIES[i % len(CITIES)],
+        'location_type': ('remote', 'onsite', 'hybrid')[i % 3],
+        'deadline': (now + timedelta(days=30 + i % 90)).date(),
+        'duration': '3 months',
+        'stipend': f"{5 + i % 20},000/month",
+        'is_active': i % 10 != 0,
+        'created_at': now - timedelta(minutes=i),
+        'updated_at': now - timedelta(minutes=i),
+    } for i in range(1, internships + 1)])
+
+    for start in range(1, applicants + 1, batch_size):
+        insert(m.Applicant, [{
+            'id': i,
+            'internship_id': rng.randint(1, internships),
+            'full_name': f"Applicant {i}",
+            'email': f"applicant{i}@example.com",
+            'phone': f"98{i:08d}",
+            'resume_path': resume,
+            'cover_letter': 'I would love to join the team.',
+            'status': rng.choice(STATUSES),
+            'applied_at': now - timedelta(seconds=i * 7),
+        } for i in range(start, min(start + batch_size, applicants + 1))])
+
+    insert(m.ContactMessage, [{
+        'id': i,
+        'name': f"Visitor {i}",
+        'email': f"visitor{i}@example.com",
+        'subject': 'Internship question',
+        'message': 'When does the next batch start? ' * 5,
+        'created_at': now - timedelta(minutes=i),
+        'is_read': i % 3 == 0,
+    } for i in range(1, messages + 1)])
+    print(f"Seeded in {time.perf_counter() - started:.1f}s")
+
+def store_bench_resume(m):
+    """Store one resume blob that every seeded applicant points at"""
+    with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as f:
+        f.write(resume_bytes(64))
+    storage = m.get_resume_storage()
+    name = 'bench-resume.pdf'
+    if not storage.exists(name):
+        storage.save(name, f.name)
+    else:
+        os.remove(f.name)
+    return name
+
+def resume_bytes(kilobytes):
+    return b'%PDF-1.4\n' + os.urandom(kilobytes * 1024) + b'\n%%EOF\n'
+
+# ======================= SCENARIOS =======================
+
+class Scenario:
+    """One route to benchmark: request i is ``method path(i)`` with form fields/files from ``form(i)``"""
+
+    def __init__(self, name, path, form=None, admin=False, ok=(200,)):
+        self.name = name
+        self.path = path
+        self.form = form
+        self.admin = admin
+        self.ok = ok
+
+    @property
+    def method(self):
+        return 'GET' if self.form is None else 'POST'
+
+def build_scenarios(m, run_id, resume_kb):
+    with m.app.app_context():
+        slugs = [slug for (slug,) in m.db.session.query(m.Internship.slug)
+                 .filter_by(is_active=True).order_by(m.Internship.id).limit(500)]
+        internship_ids = [slug_id for (slug_id,) in m.db.session.query(m.Internship.id).limit(50)]
+        middle = m.Applicant.query.order_by(m.Applicant.id).offset(m.Applicant.query.count() // 2).first()
+        recipients = [str(a_id) for (a_id,) in m.db.session.query(m.Applicant.id).limit(50)]
+    resume = resume_bytes(resume_kb)
+    deep_cursor = m.encode_cursor('after', middle.applied_at, middle.id) if middle else ''
+
+    def apply_form(i):
+        return ({'full_name': f"Bench Applicant {run_id}-{i}", 'email': f"bench-{run_id}-{i}@example.com",
+                 'phone': '9800000000', 'cover_letter': 'Benchmark application'},
+                {'resume': ('resume.pdf', resume)})
+
+    return [
+        Scenario('index', lambda i: '/'),
+        Scenario('internships', lambda i: f"/internships?location={('all', 'remote', 'onsite', 'hybrid')[i % 4]}"),
+        Scenario('internship_detail', lambda i: f"/internships/{slugs[i % len(slugs)]}"),
+        Scenario('apply', lambda i: f"/apply/{slugs[i % len(slugs)]}", form=apply_form, ok=(302,)),
+        Scenario('contact', lambda i: '/contact', ok=(302,), form=lambda i: (
+            {'name': f"Bench {i}", 'email': f"bench{i}@example.com", 'subject': 'Benchmark', 'message': 'Hello'}, {})),
+        Scenario('admin_search', lambda i: f"/admin/search?q={SEARCH_TERMS[i % len(SEARCH_TERMS)].replace(' ', '+')}",
+                 admin=True),
+        Scenario('admin_dashboard', lambda i: '/admin/dashboard', admin=True),
+        Scenario('admin_applicants', lambda i: '/admin/applicants', admin=True),
+        Scenario('admin_applicants_filtered', admin=True, path=lambda i:
+                 f"/admin/applicants?internship={internship_ids[i % len(internship_ids)]}&status=pending"),
+        Scenario('admin_applicants_deep', lambda i: f"/admin/applicants?cursor={deep_cursor}", admin=True),
+        Scenario('admin_mail', lambda i: '/admin/mail', admin=True),
+        Scenario('admin_mail_send', lambda i: '/admin/mail', admin=True, ok=(302,), form=lambda i: (
+            {'recipients': recipients, 'subject': f"Benchmark campaign {i}", 'message': 'Hello from the benchmark'}, {})),
+    ]
+
+# ======================= DRIVERS =======================
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))]
+
+def summarize(latencies, elapsed, errors):
+    latencies = sorted(latencies)
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'rps': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+    }
+
+def client_request(client, scenario, i):
+    if scenario.form is None:
+        return client.get(scenario.path(i)).status_code
+    fields, files = scenario.form(i)
+    data = dict(fields, **{name: (io.BytesIO(content), filename) for name, (filename, content) in files.items()})
+    return client.post(scenario.path(i), data=data,
+                       content_type='multipart/form-data' if files else None).status_code
+
+def run_client(app, scenario, requests, warmup):
+    client = app.test_client()
+    if scenario.admin:
+        client.post('/admin/login', data=ADMIN_LOGIN)
+    for i in range(warmup):
+        client_request(client, scenario, -1 - i)
+    latencies, errors = [], 0
+    started = time.perf_counter()
+    for i in range(requests):
+        t = time.perf_counter()
+        status = client_request(client, scenario, i)
+        latencies.append(time.perf_counter() - t)
+        errors += status not in scenario.ok
+    return summarize(latencies, time.perf_counter() - started, errors)
+
+def encode_multipart(fields, files):
+    boundary = uuid.uuid4().hex
+    body = io.BytesIO()
+    for name, value in fields.items():
+        for item in (value if isinstance(value, list) else [value]):
+            body.write(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{item}\r\n'.encode())
+    for name, (filename, content) in files.items():
+        body.write(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+                   f'Content-Type: application/pdf\r\n\r\n'.encode())
+        body.write(content + b'\r\n')
+    body.write(f'--{boundary}--\r\n'.encode())
+    return body.getvalue(), f'multipart/form-data; boundary={boundary}'
+
+class HttpSession:
+    """Minimal cookie-keeping HTTP client; redirects are returned, not followed"""
+
+    def __init__(self, port):
+        self.port = port
+        self.cookies = {}
+
+    def request(self, method, path, body=None, content_type=None):
+        connection = http.client.HTTPConnection('127.0.0.1', self.port, timeout=60)
+        headers = {}
+        if self.cookies:
+            headers['Cookie'] = '; '.join(f'{k}={v}' for k, v in self.cookies.items())
+        if content_type:
+            headers['Content-Type'] = content_type
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            for header in response.headers.get_all('Set-Cookie') or ():
+                name, _, rest = header.partition('=')
+                self.cookies[name.strip()] = rest.split(';', 1)[0]
+            return response.status
+        finally:
+            connection.close()
+
+    def send(self, scenario, i):
+        if scenario.form is None:
+            return self.request('GET', scenario.path(i))
+        fields, files = scenario.form(i)
+        body, content_type = encode_multipart(fields, files)
+        return self.request('POST', scenario.path(i), body, content_type)
+
+def run_http(port, scenario, requests, concurrency, warmup):
+    # Log every worker's session in up front: the login's password hash check must not land in a timed request
+    sessions = queue.SimpleQueue()
+    for _ in range(concurrency):
+        http_session = HttpSession(port)
+        if scenario.admin:
+            body, content_type = encode_multipart(ADMIN_LOGIN, {})
+            http_session.request('POST', '/admin/login', body, content_type)
+        sessions.put(http_session)
+    local = threading.local()
+
+    def one(i):
+        if not hasattr(local, 'session'):
+            local.session = sessions.get_nowait()
+        t = time.perf_counter()
+        status = local.session.send(scenario, i)
+        return time.perf_counter() - t, status not in scenario.ok
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(-warmup, 0)))
+        started = time.perf_counter()
+        results = list(pool.map(one, range(requests)))
+        elapsed = time.perf_counter() - started
+    return summarize([latency for latency, _ in results], elapsed, sum(error for _, error in results))
+
+def start_http_server(app):
+    from werkzeug.serving import make_server
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+# ======================= REPORTING =======================
+
+def print_results(results, baseline, tolerance):
+    """Print the results table; returns the list of regressions against the baseline"""
+    regressions = []
+    header = f"{'scenario':<34}{'req':>6}{'err':>5}{'req/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    print('\n' + header + ('   vs baseline (p95, req/s)' if baseline else ''))
+    print('-' * len(header))
+    for key, result in results.items():
+        line = (f"{key:<34}{result['requests']:>6}{result['errors']:>5}{result['rps']:>10.1f}"
+                f"{result['p50_ms']:>9.1f}{result['p95_ms']:>9.1f}{result['p99_ms']:>9.1f}")
+        base = baseline.get(key) if baseline else None
+        if base:
+            p95_change = result['p95_ms'] / base['p95_ms'] - 1 if base['p95_ms'] else 0.0
+            rps_change = result['rps'] / base['rps'] - 1 if base['rps'] else 0.0
+            regressed = p95_change > tolerance or rps_change < -tolerance
+            line += f"   {p95_change:+7.1%} {rps_change:+7.1%}" + ('  REGRESSION' if regressed else '')
+            if regressed:
+                regressions.append(key)
+        print(line)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--database-url', default='sqlite:///' + os.path.join(tempfile.gettempdir(), 'shramic-bench.db'))
+    parser.add_argument('--internships', type=int, default=5000)
+    parser.add_argument('--applicants', type=int, default=500000)
+    parser.add_argument('--messages', type=int, default=50000)
+    parser.add_argument('--requests', type=int, default=200, help='measured requests per scenario and mode')
+    parser.add_argument('--warmup', type=int, default=5)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--resume-kb', type=int, default=200)
+    parser.add_argument('--modes', default='client,http')
+    parser.add_argument('--only', help='comma-separated scenario names')
+    parser.add_argument('--baseline', help='compare against results saved with --save-baseline')
+    parser.add_argument('--save-baseline', help='write these results as JSON')
+    parser.add_argument('--tolerance', type=float, default=0.15)
+    parser.add_argument('--reset', action='store_true',
+                        help='allow reseeding a database that holds data this script did not seed')
+    args = parser.parse_args()
+
+    sink = SMTPSink()
+    # Configure the app before it is imported; it reads its settings from the environment
+    os.environ.update({
+        'DATABASE_URL': args.database_url,
+        'SECRET_KEY': 'benchmark',
+        'MAIL_SERVER': '127.0.0.1',
+        'MAIL_PORT': str(sink.port),
+        'MAIL_USE_TLS': 'False',
+        'MAIL_PASSWORD': '',
+        'OUTBOX_MODE': 'queue',
+        'STARTUP_WARMUP': 'False',
+    })
+    import api.index as m
+    app = m.app
+
+    with app.app_context():
+        m.init_db()
+        seed(m, args.internships, args.applicants, args.messages, reset=args.reset)
+
+    scenarios = build_scenarios(m, run_id=uuid.uuid4().hex[:8], resume_kb=args.resume_kb)
+    if args.only:
+        wanted = set(args.only.split(','))
+        scenarios = [scenario for scenario in scenarios if scenario.name in wanted]
+    modes = args.modes.split(',')
+    server = start_http_server(app) if 'http' in modes else None
+
+    results = {}
+    for mode in modes:
+        for scenario in scenarios:
+            print(f"{mode:>6}  {scenario.name}...", flush=True)
+            if mode == 'client':
+                result = run_client(app, scenario, args.requests, args.warmup)
+            else:
+                result = run_http(server.server_port, scenario, args.requests, args.concurrency, args.warmup)
+            results[f"{mode}:{scenario.name}"] = result
+
+    # Everything queued by apply/admin_mail_send goes out through the SMTP sink in one drain
+    with app.app_context():
+        started = time.perf_counter()
+        sent, failed = m.drain_outbox()
+        elapsed = time.perf_counter() - started
+    if sent or failed:
+        results['outbox:drain'] = {'requests': sent, 'errors': failed, 'rps': sent / elapsed if elapsed else 0.0,
+                                   'p50_ms': 0.0, 'p95_ms': 0.0, 'p99_ms': 0.0}
+    if server:
+        server.shutdown()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+    regressions = print_results(results, baseline, args.tolerance)
+    print(f"\nSMTP sink received {sink.messages} message(s)")
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump({'created_at': datetime.utcnow().isoformat(), 'args': vars(args), 'results': results},
+                      f, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.save_baseline}")
+    if regressions:
+        raise SystemExit(f"{len(regressions)} scenario(s) regressed beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Build fingerprinted static assets into static/dist
+Run: python build_assets.py
+
+For every file under static/ this writes a copy named with its content hash
+(img/logo.png -> img/logo.<hash>.png) so it can be cached forever. Images
+also get resized PNG/WebP/AVIF variants, and text assets (CSS/JS/SVG) get
+pre-compressed .gz/.br copies. static/dist/manifest.json maps each source
+path to its outputs; asset_url()/asset_srcset() in api/index.py read it.
+
+Image variants need Pillow and .br copies need brotli. Both are build-time
+only and are skipped with a warning when missing.
+"""
+
+import argparse
+import gzip
+import hashlib
+import io
+import json
+import os
+import shutil
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STATIC = os.path.join(ROOT, 'static')
+DIST = os.path.join(STATIC, 'dist')
+SKIP_DIRS = {'dist', 'uploads'}
+
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg'}
+COMPRESS_EXTENSIONS = {'.css', '.js', '.svg', '.json', '.txt'}
+VARIANT_WIDTHS = (128, 256, 480, 960)
+
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:10]
+
+def write_hashed(relative, data, suffix=''):
+    """Write data as <stem><suffix>.<hash><ext> under dist/ and return its path relative to dist/"""
+    stem, ext = os.path.splitext(relative)
+    name = f"{stem}{suffix}.{content_hash(data)}{ext}"
+    target = os.path.join(DIST, name)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    with open(target, 'wb') as f:
+        f.write(data)
+    return name.replace(os.sep, '/')
+
+def encode_image(image, fmt):
+    buffer = io.BytesIO()
+    if fmt == 'png':
+        image.save(buffer, 'PNG', optimize=True)
+    elif fmt == 'jpg':
+        image.convert('RGB').save(buffer, 'JPEG', quality=85, optimize=True, progressive=True)
+    elif fmt == 'webp':
+        image.save(buffer, 'WEBP', quality=82, method=6)
+    elif fmt == 'avif':
+        image.save(buffer, 'AVIF', quality=60)
+    return buffer.getvalue()
+
+def build_image(relative, data, entry):
+    """Write the optimised image plus resized and re-encoded variants into its manifest entry"""
+    source = Image.open(io.BytesIO(data))
+    source.load()
+    entry['width'] = source.width
+    base_format = 'jpg' if relative.lower().endswith(('.jpg', '.jpeg')) else 'png'
+    formats = [base_format] + [fmt for fmt in ('webp', 'avif') if features.check(fmt)]
+    widths = [width for width in VARIANT_WIDTHS if width < source.width] + [source.width]
+    stem, ext = os.path.splitext(relative)
+    entry['variants'] = {}
+    for fmt in formats:
+        variants = entry['variants'][fmt] = {}
+        for width in widths:
+            image = source
+            if width != source.width:
+                image = source.resize((width, round(source.height * width / source.width)), Image.LANCZOS)
+            encoded = encode_image(image, fmt)
+            if fmt == base_format and width == source.width:
+                # Only keep the re-encoded original if it actually shrank
+                if len(encoded) >= len(data):
+                    encoded = data
+                entry['file'] = write_hashed(relative, encoded)
+                variants[str(width)] = entry['file']
+                continue
+            variants[str(width)] = write_hashed(f"{stem}.{fmt}" if fmt != base_format else relative,
+                                                encoded, suffix=f"-{width}")
+
+def build_compressed(name, data, entry):
+    """Write .gz (and .br) siblings next to a hashed text asset"""
+    target = os.path.join(DIST, name)
+    encodings = []
+    with open(target + '.gz', 'wb') as f:
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    encodings.append('gzip')
+    if brotli is not None:
+        with open(target + '.br', 'wb') as f:
+            f.write(brotli.compress(data, quality=11))
+        encodings.append('br')
+    entry['encodings'] = encodings
+
+def build(verbose=True):
+    if os.path.isdir(DIST):
+        shutil.rmtree(DIST)
+    os.makedirs(DIST)
+    manifest = {}
+    before = after = 0
+    for directory, subdirs, files in os.walk(STATIC):
+        if directory == STATIC:
+            subdirs[:] = [d for d in subdirs if d not in SKIP_DIRS]
+        for filename in sorted(files):
+            path = os.path.join(directory, filename)
+            relative = os.path.relpath(path, STATIC).replace(os.sep, '/')
+            with open(path, 'rb') as f:
+                data = f.read()
+            ext = os.path.splitext(filename)[1].lower()
+            entry = {}
+            if ext in IMAGE_EXTENSIONS and Image is not None:
+                build_image(relative, data, entry)
+            else:
+                entry['file'] = write_hashed(relative, data)
+            if ext in COMPRESS_EXTENSIONS:
+                build_compressed(entry['file'], data, entry)
+            manifest[relative] = entry
+            before += len(data)
+            after += os.path.getsize(os.path.join(DIST, entry['file']))
+            if verbose:
+                print(f"{relative} -> {entry['file']} ({len(entry.get('variants', {}))} formats)")
+    with open(os.path.join(DIST, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    if verbose:
+        print(f"\nBuilt {len(manifest)} assets: {before / 1024:.0f}KB of sources, {after / 1024:.0f}KB full-size outputs")
+    if Image is None:
+        print('⚠️  Pillow not installed: image variants were skipped (pip install Pillow)')
+    if brotli is None:
+        print('⚠️  brotli not installed: .br copies were skipped (pip install brotli)')
+    return manifest
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build fingerprinted static assets into static/dist')
+    parser.add_argument('-q', '--quiet', action='store_true')
+    args = parser.parse_args()
+    build(verbose=not args.quiet)
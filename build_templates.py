@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Precompile the Jinja templates into compiled_templates.zip
+Run: python build_templates.py
+
+Each template under templates/ is compiled with the app's own Jinja
+environment into a Python module, so a fresh instance imports it instead of
+parsing and code-generating the template on first render. The zip also holds
+manifest.json with the Jinja version and a hash of every template source;
+api/index.py only uses a compiled template while its source still matches,
+so a stale bundle falls back to compiling from source rather than serving
+old markup. Re-run after editing templates.
+
+--bytecode-cache instead pre-populates the Jinja bytecode cache directory
+that long-running workers share (TEMPLATE_CACHE_DIR, by default Jinja's
+per-user 0700 temp directory), e.g. from a deploy hook before gunicorn
+starts. --app app does the same for the standalone app.py server.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+import zipfile
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+TARGET = os.path.join(ROOT, 'compiled_templates.zip')
+
+def build(target=TARGET, verbose=True):
+    # Compile against the plain source loader, not an existing bundle
+    os.environ['TEMPLATE_BUNDLE'] = ''
+    sys.path.insert(0, ROOT)
+    from jinja2 import ModuleLoader, __version__ as jinja_version
+    from api.index import app, template_source_hash
+
+    env = app.jinja_env
+    manifest = {'jinja_version': jinja_version, 'templates': {}}
+    total_ms = 0.0
+    with zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name in env.list_templates(extensions=['html', 'txt', 'xml']):
+            source, filename, _ = env.loader.get_source(env, name)
+            started = time.perf_counter()
+            code = env.compile(source, name, filename, raw=True, defer_init=True)
+            elapsed = (time.perf_counter() - started) * 1000
+            total_ms += elapsed
+            archive.writestr(ModuleLoader.get_module_filename(name), code)
+            manifest['templates'][name] = template_source_hash(name)
+            if verbose:
+                print(f"{name} ({elapsed:.1f}ms)")
+        archive.writestr('manifest.json', json.dumps(manifest, indent=2, sort_keys=True))
+    if verbose:
+        print(f"\nCompiled {len(manifest['templates'])} templates into {os.path.relpath(target, ROOT)}; "
+              f"{total_ms:.0f}ms of compile work moved out of cold starts")
+    return manifest
+
+def warm_bytecode_cache(module='api.index', verbose=True):
+    """Load every template once through the app's environment so its bytecode cache is filled"""
+    sys.path.insert(0, ROOT)
+    app = importlib.import_module(module).app
+    env = app.jinja_env
+    if env.bytecode_cache is None:
+        raise SystemExit(f"{module} has no template bytecode cache configured (TEMPLATE_CACHE_DIR)")
+    names = env.list_templates(extensions=['html', 'txt', 'xml'])
+    for name in names:
+        env.get_template(name)
+    if verbose:
+        print(f"Cached bytecode for {len(names)} templates in {env.bytecode_cache.directory}")
+    return names
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Precompile Jinja templates into compiled_templates.zip')
+    parser.add_argument('-q', '--quiet', action='store_true')
+    parser.add_argument('-o', '--output', default=TARGET)
+    parser.add_argument('--bytecode-cache', action='store_true',
+                        help='fill the Jinja bytecode cache directory instead of building the bundle')
+    parser.add_argument('--app', default='api.index', help="module holding the Flask app (api.index or app)")
+    args = parser.parse_args()
+    if args.bytecode_cache:
+        # Compile from source so every template goes through the cache
+        os.environ['TEMPLATE_BUNDLE'] = ''
+        warm_bytecode_cache(args.app, verbose=not args.quiet)
+    else:
+        build(args.output, verbose=not args.quiet)
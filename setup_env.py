@@ -15,6 +15,7 @@ def create_env_file():
     """Create .env file with generated SECRET_KEY"""
     
     secret_key = generate_secret_key()
+    cron_secret = generate_secret_key()
     
     env_content = f"""# Flask Configuration
 SECRET_KEY={secret_key}
@@ -38,6 +39,18 @@ MAIL_DEFAULT_SENDER=Shramic <shramicnetworks@gmail.com>
 # Application Settings
 UPLOAD_FOLDER=static/uploads
 MAX_CONTENT_LENGTH=16777216
+
+# Resume Storage - 'filesystem' or 's3' (AWS S3, or a local MinIO via S3_ENDPOINT_URL)
+RESUME_STORAGE=filesystem
+# S3_BUCKET=shramic-resumes
+# S3_ENDPOINT_URL=http://localhost:9000
+# AWS_ACCESS_KEY_ID=minioadmin
+# AWS_SECRET_ACCESS_KEY=minioadmin
+
+# Email Outbox - 'thread' sends from a local pool; 'queue' (default on Vercel) waits for /tasks/outbox/drain
+# OUTBOX_MODE=thread
+# Bearer token the drain endpoint requires; the vercel.json cron sends it automatically
+CRON_SECRET={cron_secret}
 """
     
     # Check if .env already exists
@@ -58,7 +71,9 @@ MAX_CONTENT_LENGTH=16777216
     print('   - Visit: https://myaccount.google.com/apppasswords')
     print('   - Generate an app password for "Mail"')
     print('2. For production, update DATABASE_URL with PostgreSQL connection')
-    print('3. Add .env to .gitignore (already included)')
+    print('3. On Vercel, set CRON_SECRET in the project env so the outbox cron can drain email')
+    print('   - The vercel.json cron runs every 5 minutes; Hobby plans only allow daily schedules')
+    print('4. Add .env to .gitignore (already included)')
     print('\n⚠️  NEVER commit .env file to Git!')
     
     # Create .env.example for reference
@@ -80,6 +95,9 @@ MAIL_DEFAULT_SENDER=Your Name <your-email@gmail.com>
 # Application Settings
 UPLOAD_FOLDER=static/uploads
 MAX_CONTENT_LENGTH=16777216
+
+# Email Outbox (Vercel Cron calls /tasks/outbox/drain with this bearer token)
+CRON_SECRET=your-cron-secret-here
 """
     
     with open('.env.example', 'w') as f: